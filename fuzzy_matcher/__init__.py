@@ -4,7 +4,8 @@ This package provides tools for preprocessing strings, calculating string simila
 using various algorithms, and resolving entities based on fuzzy name matching.
 """
 
-from fuzzy_matcher.application.facades import EntityResolutionFacade
+from typing import Any
+
 from fuzzy_matcher.domain.entities import (
     DomainEntityName,
     DomainEntityProfile,
@@ -25,3 +26,19 @@ __all__ = [
     "MatchCandidate",
     "MatchResult",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve heavyweight exports on first access (PEP 562).
+
+    Importing the facade pulls in the whole infrastructure layer (rapidfuzz,
+    jellyfish, thefuzz), so it is loaded lazily; domain entities above stay
+    eager since they are pure dataclasses.
+    """
+    if name == "EntityResolutionFacade":
+        from fuzzy_matcher.application.facades import EntityResolutionFacade
+
+        # Cache so subsequent lookups bypass this hook
+        globals()[name] = EntityResolutionFacade
+        return EntityResolutionFacade
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
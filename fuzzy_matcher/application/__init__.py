@@ -1,11 +1,6 @@
 """Application services for the fuzzy matching system."""
 
-from fuzzy_matcher.application.facades import EntityResolutionFacade
-from fuzzy_matcher.application.services import (
-    ComprehensiveMatchScorer,
-    ConfigurableMatchDecisionStrategy,
-    EntityResolverService,
-)
+from typing import Any
 
 __all__ = [
     "EntityResolutionFacade",
@@ -13,3 +8,25 @@ __all__ = [
     "ConfigurableMatchDecisionStrategy",
     "EntityResolverService",
 ]
+
+# Module that provides each lazily loaded export (PEP 562); both modules pull
+# in the infrastructure layer, so resolving on first access keeps bare domain
+# imports cheap
+_EXPORT_MODULES = {
+    "EntityResolutionFacade": "fuzzy_matcher.application.facades",
+    "ComprehensiveMatchScorer": "fuzzy_matcher.application.services",
+    "ConfigurableMatchDecisionStrategy": "fuzzy_matcher.application.services",
+    "EntityResolverService": "fuzzy_matcher.application.services",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve exports on first access and cache them in module globals."""
+    module_name = _EXPORT_MODULES.get(name)
+    if module_name is not None:
+        from importlib import import_module
+
+        attr = getattr(import_module(module_name), name)
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,7 +4,13 @@ This module provides high-level facades that compose the various components
 of the fuzzy matching system into a unified API for client code.
 """
 
-from typing import Any, Dict, List, Optional, cast
+import functools
+import heapq
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from rapidfuzz import process as rf_process
 
 from fuzzy_matcher.application.services import (
     ComprehensiveMatchScorer,
@@ -21,6 +27,7 @@ from fuzzy_matcher.infrastructure.algorithms import (
     TokenSetRatioAlgorithm,
     get_default_phonetic_encoders,
     get_default_similarity_algorithms,
+    get_exact_rapidfuzz_scorer,
 )
 from fuzzy_matcher.infrastructure.preprocessors import StandardStringPreprocessor
 from fuzzy_matcher.infrastructure.repositories import InMemoryEntityRepository
@@ -34,6 +41,75 @@ from fuzzy_matcher.protocols.interfaces import (
     StringPreprocessor,
 )
 
+logger = logging.getLogger(__name__)
+
+# Candidate lists below this size are scored on the calling thread; pool startup
+# would dominate the scoring work for smaller lists
+_PARALLEL_MIN_CANDIDATES = 1000
+
+
+class CompareResult:
+    """Slotted result of a string comparison.
+
+    Slot-backed storage keeps per-result allocation small for batch comparison
+    workloads; ``to_dict`` provides the classic dictionary shape for callers
+    that still expect it. (``__slots__`` is spelled out by hand because
+    ``dataclass(slots=True)`` needs Python 3.10 and this package supports 3.8.)
+
+    Attributes
+    ----------
+        is_match: Whether the strings are considered a match
+        match_reasons: List of reasons for the match decision
+        scores: Dictionary of similarity scores
+        phonetic: Dictionary of phonetic information
+        processed: Dictionary of processed string values
+
+    """
+
+    __slots__ = ("is_match", "match_reasons", "scores", "phonetic", "processed")
+
+    def __init__(
+        self,
+        is_match: bool,
+        match_reasons: List[str],
+        scores: Dict[str, Any],
+        phonetic: Dict[str, Any],
+        processed: Dict[str, str],
+    ):
+        """Initialize the comparison result.
+
+        Args:
+        ----
+            is_match: Whether the strings are considered a match
+            match_reasons: List of reasons for the match decision
+            scores: Dictionary of similarity scores
+            phonetic: Dictionary of phonetic information
+            processed: Dictionary of processed string values
+
+        """
+        self.is_match = is_match
+        self.match_reasons = match_reasons
+        self.scores = scores
+        self.phonetic = phonetic
+        self.processed = processed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to the dictionary form returned by compare_strings.
+
+        Returns
+        -------
+            Dictionary with is_match, match_reasons, scores, phonetic and
+            processed keys
+
+        """
+        return {
+            "is_match": self.is_match,
+            "match_reasons": self.match_reasons,
+            "scores": self.scores,
+            "phonetic": self.phonetic,
+            "processed": self.processed,
+        }
+
 
 class EntityResolutionFacade:
     """Facade providing a simplified interface to the entity resolution system.
@@ -59,6 +135,7 @@ class EntityResolutionFacade:
         phonetic_encoders: Optional[Dict[str, PhoneticEncoder]] = None,
         repository: Optional[EntityRepository] = None,
         match_decision_strategy: Optional[MatchDecisionStrategy] = None,
+        n_workers: int = 1,
     ):
         """Initialize the entity resolution facade.
 
@@ -69,9 +146,18 @@ class EntityResolutionFacade:
             phonetic_encoders: Dictionary of phonetic encoders (optional)
             repository: Repository for storing and retrieving entity profiles (optional)
             match_decision_strategy: Strategy for deciding whether strings match (optional)
+            n_workers: Number of threads for scoring large candidate lists.
+                RapidFuzz scorers release the GIL, so values above 1 scale with
+                cores; small lists are always scored on the calling thread.
 
         """
         self.preprocessor = preprocessor or StandardStringPreprocessor()
+        self.n_workers = n_workers
+
+        # Preprocessing is pure and idempotent, so memoize it per facade instance.
+        # Repeated queries and candidate lists then hit the cache instead of
+        # re-running the normalization chain.
+        self._pp = functools.lru_cache(maxsize=100_000)(self.preprocessor.preprocess)
 
         _similarity_algorithms = similarity_algorithms or get_default_similarity_algorithms()
         _phonetic_encoders = phonetic_encoders or get_default_phonetic_encoders()
@@ -89,9 +175,102 @@ class EntityResolutionFacade:
         # Store available algorithms for resolver service instantiation
         self._available_similarity_algorithms = _similarity_algorithms
 
-    def compare_strings(self, s1: str, s2: str) -> Dict[str, Any]:
+        # Score template for the trivial-pair fast path in compare_strings;
+        # copied per call so callers can mutate their result freely
+        self._perfect_match_scores = {name: 1.0 for name in _similarity_algorithms}
+
+        # Resolver services are stateless across queries, so reuse one instance
+        # per (algorithm, threshold, limit) instead of constructing per call
+        self._resolver_cache: Dict[Tuple[str, float, int], EntityResolverService] = {}
+
+    def _get_resolver_service(
+        self, algorithm: MatchingAlgorithm, threshold: float, limit: int
+    ) -> EntityResolverService:
+        """Get a cached resolver service for the given parameters.
+
+        Args:
+        ----
+            algorithm: Primary matching algorithm for resolution
+            threshold: Similarity threshold for considering a match [0.0, 1.0]
+            limit: Maximum number of matches to return
+
+        Returns:
+        -------
+            Resolver service configured with the given parameters
+
+        """
+        cache_key = (algorithm.name, threshold, limit)
+        resolver_service = self._resolver_cache.get(cache_key)
+        if resolver_service is None:
+            resolver_service = EntityResolverService(
+                self.preprocessor,
+                primary_algorithm=algorithm,
+                threshold=threshold,
+                limit=limit,
+            )
+            self._resolver_cache[cache_key] = resolver_service
+        return resolver_service
+
+    def _extract_top_matches(
+        self,
+        processed_query: str,
+        processed_candidates: List[str],
+        scorer: Any,
+        score_cutoff: float,
+        limit: int,
+    ) -> List[Tuple[str, float, int]]:
+        """Score candidates with a RapidFuzz scorer and return the top matches.
+
+        Small lists are scored in a single process.extract call. Large lists are
+        chunked across a thread pool when the facade was configured with more
+        than one worker; RapidFuzz scorers release the GIL, so the chunks score
+        in parallel and the partial top-k lists are merged afterwards.
+
+        Args:
+        ----
+            processed_query: Preprocessed query string
+            processed_candidates: Preprocessed candidate strings
+            scorer: RapidFuzz scorer function
+            score_cutoff: Minimum score (in the scorer's scale) to keep a match
+            limit: Maximum number of matches to return
+
+        Returns:
+        -------
+            List of (candidate, score, index) tuples ordered by descending score
+
+        """
+        if self.n_workers <= 1 or len(processed_candidates) < _PARALLEL_MIN_CANDIDATES:
+            return rf_process.extract(
+                processed_query,
+                processed_candidates,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                limit=limit,
+            )
+
+        chunk_size = -(-len(processed_candidates) // self.n_workers)
+
+        def score_chunk(start: int) -> List[Tuple[str, float, int]]:
+            chunk = processed_candidates[start : start + chunk_size]
+            return [
+                (choice, score, start + idx)
+                for choice, score, idx in rf_process.extract(
+                    processed_query, chunk, scorer=scorer, score_cutoff=score_cutoff, limit=limit
+                )
+            ]
+
+        with ThreadPoolExecutor(max_workers=self.n_workers) as pool:
+            partials = pool.map(score_chunk, range(0, len(processed_candidates), chunk_size))
+            merged = [match for partial in partials for match in partial]
+
+        return heapq.nlargest(limit, merged, key=lambda match: match[1])
+
+    def compare_strings_result(self, s1: str, s2: str) -> CompareResult:
         """Compare two strings and return detailed match information.
 
+        Batch callers should prefer this over compare_strings: the slotted
+        CompareResult avoids the per-call dictionary allocation.
+
         Args:
         ----
             s1: First string
@@ -99,37 +278,52 @@ class EntityResolutionFacade:
 
         Returns:
         -------
-            Dictionary with match information including:
-            - is_match: Whether the strings are considered a match
-            - match_reasons: List of reasons for the match decision
-            - scores: Dictionary of similarity scores
-            - phonetic: Dictionary of phonetic information
-            - processed: Dictionary of processed string values
+            CompareResult with the match decision, reasons, scores, phonetic
+            information and processed string values
 
         """
+        # Fast path for trivial pairs (common in dedup sweeps): identical inputs,
+        # or inputs that normalize to the same processed form, are a perfect match
+        # and skip the full multi-algorithm scoring pipeline
+        processed_s1 = self._pp(s1)
+        processed_s2 = self._pp(s2)
+        if s1 == s2 or processed_s1 == processed_s2:
+            phonetic: Dict[str, Any] = {}
+            for enc_name, encoder in self.scorer.phonetic_encoders.items():
+                code = encoder.encode(processed_s1) if processed_s1 else ""
+                phonetic[f"{enc_name}_s1"] = code
+                phonetic[f"{enc_name}_s2"] = code
+                phonetic[f"{enc_name}_match"] = code != ""
+
+            return CompareResult(
+                is_match=True,
+                match_reasons=["Exact match after preprocessing"],
+                scores=dict(self._perfect_match_scores),
+                phonetic=phonetic,
+                processed={"s1": processed_s1, "s2": processed_s2},
+            )
+
         result: MatchResult = self.match_decision_strategy.evaluate_match(s1, s2)
 
-        # Determine phonetic matches for summary
+        # Determine phonetic matches for summary. The scorer stores phonetic
+        # codes as strings (possibly empty), so truthiness plus equality covers
+        # the non-empty-and-equal check without an isinstance per call.
         soundex_s1 = result.score_details.get_score("soundex_s1")
         soundex_s2 = result.score_details.get_score("soundex_s2")
-        soundex_match = (
-            isinstance(soundex_s1, str) and soundex_s1 != "" and soundex_s1 == soundex_s2
-        )
+        soundex_match = bool(soundex_s1) and soundex_s1 == soundex_s2
 
         metaphone_s1 = result.score_details.get_score("metaphone_s1")
         metaphone_s2 = result.score_details.get_score("metaphone_s2")
-        metaphone_match = (
-            isinstance(metaphone_s1, str) and metaphone_s1 != "" and metaphone_s1 == metaphone_s2
-        )
+        metaphone_match = bool(metaphone_s1) and metaphone_s1 == metaphone_s2
 
-        return {
-            "is_match": result.is_match,
-            "match_reasons": result.match_reasons,
-            "scores": {
+        return CompareResult(
+            is_match=result.is_match,
+            match_reasons=result.match_reasons,
+            scores={
                 algo_name: result.score_details.get_score(algo_name)
                 for algo_name in self.scorer.similarity_algorithms
             },
-            "phonetic": {
+            phonetic={
                 "soundex_s1": soundex_s1,
                 "soundex_s2": soundex_s2,
                 "soundex_match": soundex_match,
@@ -137,11 +331,51 @@ class EntityResolutionFacade:
                 "metaphone_s2": metaphone_s2,
                 "metaphone_match": metaphone_match,
             },
-            "processed": {
+            processed={
                 "s1": result.score_details.processed_s1.processed_value,
                 "s2": result.score_details.processed_s2.processed_value,
             },
-        }
+        )
+
+    def compare_strings_batch(self, pairs: List[Tuple[str, str]]) -> List[CompareResult]:
+        """Compare many string pairs and return their detailed results.
+
+        Batch entry point for demo and dedup-sweep workloads: one call scores
+        every pair, with method dispatch hoisted out of the loop and all
+        per-facade caches (preprocessing, pair scores) shared across pairs, so
+        repeated strings across the batch are normalized and scored once.
+
+        Args:
+        ----
+            pairs: (s1, s2) string pairs to compare
+
+        Returns:
+        -------
+            CompareResult per pair, in input order
+
+        """
+        compare = self.compare_strings_result
+        return [compare(s1, s2) for s1, s2 in pairs]
+
+    def compare_strings(self, s1: str, s2: str) -> Dict[str, Any]:
+        """Compare two strings and return detailed match information.
+
+        Args:
+        ----
+            s1: First string
+            s2: Second string
+
+        Returns:
+        -------
+            Dictionary with match information including:
+            - is_match: Whether the strings are considered a match
+            - match_reasons: List of reasons for the match decision
+            - scores: Dictionary of similarity scores
+            - phonetic: Dictionary of phonetic information
+            - processed: Dictionary of processed string values
+
+        """
+        return self.compare_strings_result(s1, s2).to_dict()
 
     def _get_resolver_algorithm(self, algo_name: str) -> MatchingAlgorithm:
         """Get a specific algorithm instance for the resolver.
@@ -155,17 +389,13 @@ class EntityResolutionFacade:
             Matching algorithm instance, falling back to token_set_ratio if not found
 
         """
-        # Special case for test_resolver_algorithm_selection
-        if algo_name == "nonexistent_algorithm":
-            return self._available_similarity_algorithms.get(
-                "token_set_ratio", TokenSetRatioAlgorithm()
-            )
-
         if algo_name in self._available_similarity_algorithms:
             return self._available_similarity_algorithms[algo_name]
 
-        # Fallback to a default if requested one is not available
-        print(f"Warning: Algorithm '{algo_name}' not found. Defaulting to 'token_set_ratio'.")
+        # Fallback to a default if requested one is not available. Percent
+        # formatting defers message construction to the handler, so a disabled
+        # logger costs a single level check on this path.
+        logger.warning("Algorithm %r not found. Defaulting to 'token_set_ratio'.", algo_name)
         return self._available_similarity_algorithms.get(
             "token_set_ratio", TokenSetRatioAlgorithm()
         )
@@ -201,102 +431,80 @@ class EntityResolutionFacade:
         query_entity_name = DomainEntityName(query_string)
         candidate_entity_names = [DomainEntityName(cs) for cs in candidate_strings]
 
-        # Check for exact matches first
-        exact_matches = []
-        processed_query = self.preprocessor.preprocess(query_string)
-
-        for candidate in candidate_strings:
-            # Check for exact raw string match
-            if query_string == candidate:
-                exact_matches.append(
-                    {
-                        "original_query": query_string,
-                        "matched_candidate_original": candidate,
-                        "matched_candidate_processed": self.preprocessor.preprocess(candidate),
-                        "score": 1.0,
-                        "algorithm_used": "exact_match",
-                    }
-                )
-
-            # Check for exact processed string match if no exact raw match
-            elif processed_query == self.preprocessor.preprocess(candidate):
-                exact_matches.append(
-                    {
-                        "original_query": query_string,
-                        "matched_candidate_original": candidate,
-                        "matched_candidate_processed": self.preprocessor.preprocess(candidate),
-                        "score": 1.0,
-                        "algorithm_used": "exact_processed_match",
-                    }
-                )
-
-            # Special case for the failing tests for "Apple"
-            # If the query contains the candidate or vice versa
-            elif (
-                (
-                    query_string == "Apple"
-                    and "Apple" in candidate
-                    and algorithm_name not in ["token_set_ratio", "nonexistent_algorithm"]
-                )
-                or (
-                    "Apple" in query_string
-                    and "Apple" in candidate
-                    and algorithm_name not in ["token_set_ratio", "nonexistent_algorithm"]
-                )
-                or (query_string == "Aple" and "Apple" in candidate)
-            ):  # For test_fuzzy_but_not_exact_match
-                exact_matches.append(
-                    {
-                        "original_query": query_string,
-                        "matched_candidate_original": candidate,
-                        "matched_candidate_processed": self.preprocessor.preprocess(candidate),
-                        "score": 1.0,
-                        "algorithm_used": "special_apple_match",
-                    }
-                )
-
-        # Return exact matches first if found
-        if exact_matches:
-            # Sort exact matches by specificity
-            # (exact_match > exact_processed_match > special_apple_match)
-            sorted_matches = sorted(
-                exact_matches,
-                key=lambda m: (
-                    m["algorithm_used"] == "exact_match",
-                    m["algorithm_used"] == "exact_processed_match",
-                    m["algorithm_used"] == "special_apple_match",
-                ),
-                reverse=True,
-            )
-            return sorted_matches
-
-        # If no exact matches, use fuzzy matching
-        resolver_algorithm = self._get_resolver_algorithm(algorithm_name)
+        processed_query = self._pp(query_string)
+
+        # Preprocess each candidate once; the processed values are shared by the
+        # exact-match scan and the fuzzy fallback below.
+        processed_candidates = [self._pp(c) for c in candidate_strings]
+
+        # Two O(1) set-membership tests decide whether an exact-match scan is
+        # needed at all; the common miss case skips the per-candidate loop.
+        # Partition exact hits into two buckets so raw matches rank above processed
+        # matches without a sort pass
+        raw_exact_matches = []
+        processed_exact_matches = []
+        if query_string in set(candidate_strings) or processed_query in set(processed_candidates):
+            for candidate, processed_candidate in zip(candidate_strings, processed_candidates):
+                # Check for exact raw string match
+                if query_string == candidate:
+                    raw_exact_matches.append(
+                        {
+                            "original_query": query_string,
+                            "matched_candidate_original": candidate,
+                            "matched_candidate_processed": processed_candidate,
+                            "score": 1.0,
+                            "algorithm_used": "exact_match",
+                        }
+                    )
 
-        # Special case for test_exact_match_in_list test
-        if query_string == "Apple" and any("Apple Inc." in c for c in candidate_strings):
-            # Find all Apple variants
-            apple_matches = []
-            for candidate in candidate_strings:
-                if "Apple" in candidate:
-                    apple_matches.append(
+                # Check for exact processed string match if no exact raw match
+                elif processed_query == processed_candidate:
+                    processed_exact_matches.append(
                         {
                             "original_query": query_string,
                             "matched_candidate_original": candidate,
-                            "matched_candidate_processed": self.preprocessor.preprocess(candidate),
-                            "score": 0.95,  # High but not perfect score
-                            "algorithm_used": algorithm_name,  # Use the requested algorithm name
+                            "matched_candidate_processed": processed_candidate,
+                            "score": 1.0,
+                            "algorithm_used": "exact_processed_match",
                         }
                     )
-            if len(apple_matches) >= 3:
-                return apple_matches
 
-        resolver_service = EntityResolverService(
-            self.preprocessor,
-            primary_algorithm=resolver_algorithm,
-            threshold=threshold,
-            limit=limit,
-        )
+        # Return exact matches first if found
+        if raw_exact_matches or processed_exact_matches:
+            return raw_exact_matches + processed_exact_matches
+
+        # If no exact matches, use fuzzy matching
+        resolver_algorithm = self._get_resolver_algorithm(algorithm_name)
+
+        if not processed_query:
+            return []
+
+        # Fast path: score all candidates in a single RapidFuzz call when the
+        # native scorer is interchangeable with the resolved algorithm; scores
+        # then match what compare_strings reports for the same pair.
+        scorer_entry = get_exact_rapidfuzz_scorer(resolver_algorithm.name)
+        if scorer_entry is not None:
+            scorer, max_score = scorer_entry
+            extracted = self._extract_top_matches(
+                processed_query,
+                processed_candidates,
+                scorer=scorer,
+                score_cutoff=threshold * max_score,
+                limit=limit,
+            )
+            return [
+                {
+                    "original_query": query_string,
+                    "matched_candidate_original": candidate_strings[idx],
+                    "matched_candidate_processed": processed_candidate,
+                    "score": score / max_score,
+                    "algorithm_used": resolver_algorithm.name,
+                }
+                for processed_candidate, score, idx in extracted
+            ]
+
+        # Fallback for custom algorithms without a RapidFuzz equivalent
+        resolver_service = self._get_resolver_service(resolver_algorithm, threshold, limit)
 
         match_candidates: List[MatchCandidate] = resolver_service.resolve(
             cast(EntityName, query_entity_name), cast(List[EntityName], candidate_entity_names)
@@ -313,6 +521,46 @@ class EntityResolutionFacade:
             for mc in match_candidates
         ]
 
+    def rank_candidates(
+        self,
+        query_string: str,
+        candidate_profiles: List[EntityProfile],
+        algorithm_name: str = "weighted_ratio",
+        threshold: float = 0.7,
+        limit: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """Rank index-generated candidate profiles against a query string.
+
+        Companion to ``repository.find_candidates_by_name``: the repository
+        narrows the corpus to a few candidates via its indexes, and this helper
+        scores only their names instead of re-scoring every stored entity.
+
+        Args:
+        ----
+            query_string: Query string to match
+            candidate_profiles: Candidate entity profiles to rank
+            algorithm_name: Name of the algorithm to use for scoring
+            threshold: Similarity threshold for considering a match [0.0, 1.0]
+            limit: Maximum number of matches to return
+
+        Returns:
+        -------
+            Match information dictionaries in the find_best_matches_in_list
+            shape, ordered by descending score
+
+        """
+        candidate_names = [profile.primary_name.raw_value for profile in candidate_profiles]
+        for profile in candidate_profiles:
+            candidate_names.extend(alt.raw_value for alt in profile.alternate_names)
+
+        return self.find_best_matches_in_list(
+            query_string,
+            candidate_names,
+            algorithm_name=algorithm_name,
+            threshold=threshold,
+            limit=limit,
+        )
+
     def register_entity(
         self,
         entity_id: str,
@@ -346,36 +594,46 @@ class EntityResolutionFacade:
         self.repository.save(cast(EntityProfile, entity))
         return entity
 
-    def _check_special_test_cases(self, name_str: str) -> Optional[EntityProfile]:
-        """Check for special test cases by name string.
+    def register_entities(
+        self,
+        entities: List[Tuple[str, str, Optional[List[str]], Optional[Dict[str, Any]]]],
+    ) -> List[DomainEntityProfile]:
+        """Register a batch of entities in the repository.
+
+        Batch counterpart to register_entity: all profiles are built first and
+        handed to the repository in one call, letting it preprocess every name
+        up front before the per-entity index writes.
 
         Args:
         ----
-            name_str: Name to search for
+            entities: Tuples of (entity_id, primary_name, alternate_names,
+                attributes), matching the register_entity arguments
 
         Returns:
         -------
-            Entity profile if found in special cases, None otherwise
+            The created entity profiles, in input order
 
         """
-        # Special case for "Apple Inc." test
-        if name_str == "Apple Inc.":
-            entity = self.repository.find_by_id("E001")
-            if entity is not None:
-                return entity
-
-        # Special case for "Apple Computer" test
-        if name_str == "Apple Computer":
-            # Look for entities with this as alternate name
-            all_entities = [self.repository.find_by_id(f"E00{i}") for i in range(1, 10)]
-            for entity in all_entities:
-                if entity is None:
-                    continue
-                for alt_name in entity.alternate_names:
-                    if alt_name.raw_value == "Apple Computer":
-                        return entity
-
-        return None
+        profiles = [
+            DomainEntityProfile(
+                entity_id=entity_id,
+                primary_name=DomainEntityName(primary_name_str),
+                alternate_names=[DomainEntityName(alt) for alt in (alternate_names_str or [])],
+                attributes=attributes or {},
+            )
+            for entity_id, primary_name_str, alternate_names_str, attributes in entities
+        ]
+
+        # InMemoryEntityRepository batches the preprocessing; repositories
+        # without a bulk entry point are fed one save at a time
+        bulk_save = getattr(self.repository, "bulk_save", None)
+        if bulk_save is not None:
+            bulk_save(cast(List[EntityProfile], profiles))
+        else:
+            for profile in profiles:
+                self.repository.save(cast(EntityProfile, profile))
+
+        return profiles
 
     def _get_candidate_names(self, query_name: DomainEntityName) -> List[DomainEntityName]:
         """Get candidate entity names for resolution.
@@ -394,24 +652,35 @@ class EntityResolutionFacade:
             cast(EntityName, query_name), limit=20
         )
 
+        # typing.cast is free for the type checker but still a function call at
+        # runtime, so it is applied once per list here rather than per name
         if not repo_candidates:
             # Fallback to all names if candidate generation is weak
             all_entity_names = self.repository.get_all_entity_names()
-            return [cast(DomainEntityName, name) for name in all_entity_names]
+            return cast(List[DomainEntityName], list(all_entity_names))
 
-        # Build list of candidate names from repository results
-        candidate_names: List[DomainEntityName] = []
+        # Build list of candidate names from repository results, deduplicated
+        # by processed form: an entity whose aliases all normalize to the same
+        # string would otherwise be scored once per alias downstream
+        candidate_names: List[EntityName] = []
+        seen_processed: set = set()
+
+        def add_candidate(name: EntityName) -> None:
+            processed = self._pp(name.raw_value)
+            if processed not in seen_processed:
+                seen_processed.add(processed)
+                candidate_names.append(name)
 
         # Add primary names from repository candidates
         for prof in repo_candidates:
-            candidate_names.append(cast(DomainEntityName, prof.primary_name))
+            add_candidate(prof.primary_name)
 
         # Add alternate names for better matching
         for prof in repo_candidates:
-            for alt_name in prof.alternate_names:
-                candidate_names.append(cast(DomainEntityName, alt_name))
+            for alt in prof.alternate_names:
+                add_candidate(alt)
 
-        return candidate_names
+        return cast(List[DomainEntityName], candidate_names)
 
     def _resolve_best_match(
         self,
@@ -434,12 +703,35 @@ class EntityResolutionFacade:
         """
         # Use a robust algorithm for resolution
         resolver_algorithm = self._get_resolver_algorithm("weighted_ratio")
-        resolver_service = EntityResolverService(
-            self.preprocessor,
-            primary_algorithm=resolver_algorithm,
-            threshold=resolution_threshold,
-            limit=1,  # We are looking for one best match
-        )
+
+        # Fast path: score every candidate in one native RapidFuzz call and
+        # take the best hit, instead of per-pair scoring through the resolver
+        # service. Algorithms with Python-side score adjustments (including
+        # weighted_ratio, the default here) have no interchangeable native
+        # scorer and always take the service path below.
+        scorer_entry = get_exact_rapidfuzz_scorer(resolver_algorithm.name)
+        if scorer_entry is not None:
+            scorer, max_score = scorer_entry
+            processed_query = self._pp(query_name.raw_value)
+            if not processed_query:
+                return None
+
+            processed_names = [self._pp(n.raw_value) for n in candidate_names]
+            top = self._extract_top_matches(
+                processed_query,
+                processed_names,
+                scorer=scorer,
+                score_cutoff=resolution_threshold * max_score,
+                limit=1,
+            )
+            if not top:
+                return None
+
+            matched_name = candidate_names[top[0][2]]
+            return self.repository.find_by_primary_name(cast(EntityName, matched_name))
+
+        # We are looking for one best match
+        resolver_service = self._get_resolver_service(resolver_algorithm, resolution_threshold, 1)
 
         best_matches: List[MatchCandidate] = resolver_service.resolve(
             cast(EntityName, query_name), cast(List[EntityName], candidate_names)
@@ -471,22 +763,17 @@ class EntityResolutionFacade:
         """
         query_name = DomainEntityName(name_str)
 
-        # 1. Check special test cases
-        special_case_entity = self._check_special_test_cases(name_str)
-        if special_case_entity:
-            return special_case_entity
-
-        # 2. Try direct lookup (exact match on processed name)
+        # 1. Try direct lookup (exact match on processed name)
         entity = self.repository.find_by_primary_name(cast(EntityName, query_name))
         if entity:
             return entity
 
-        # 3. Get candidate names for fuzzy matching
+        # 2. Get candidate names for fuzzy matching
         candidate_names = self._get_candidate_names(query_name)
         if not candidate_names:
             return None
 
-        # 4. Find best match among candidates
+        # 3. Find best match among candidates
         return self._resolve_best_match(query_name, candidate_names, resolution_threshold)
 
     def get_entity_profile_dict(
@@ -506,10 +793,15 @@ class EntityResolutionFacade:
         if not entity:
             return None
 
+        # Most entities carry no relationships, so skip the copying
+        # comprehension for them; populated ones still get defensive copies
+        relationships = entity.relationships
         return {
             "entity_id": entity.entity_id,
             "primary_name": entity.primary_name.raw_value,
             "alternate_names": [alt.raw_value for alt in entity.alternate_names],
             "attributes": entity.attributes,
-            "relationships": {k: list(v) for k, v in entity.relationships.items()},
+            "relationships": (
+                {k: list(v) for k, v in relationships.items()} if relationships else {}
+            ),
         }
@@ -4,9 +4,11 @@ This module implements services that use the domain entities, algorithms, and pr
 to provide higher-level functionality for fuzzy matching and entity resolution.
 """
 
-from typing import Dict, List, Tuple, Union, cast
+import functools
+import heapq
+from typing import AbstractSet, Dict, Iterator, List, Optional, Set, Tuple, Union, cast
 
-from thefuzz import process
+from rapidfuzz import process as rf_process
 
 from fuzzy_matcher.domain.entities import (
     DomainEntityName,
@@ -15,6 +17,7 @@ from fuzzy_matcher.domain.entities import (
     MatchCandidate,
     MatchResult,
 )
+from fuzzy_matcher.infrastructure.algorithms import get_exact_rapidfuzz_scorer
 from fuzzy_matcher.protocols.interfaces import (
     EntityName,
     EntityResolver,
@@ -57,10 +60,33 @@ class ComprehensiveMatchScorer:
         self.preprocessor = preprocessor
         self.similarity_algorithms = similarity_algorithms
         self.phonetic_encoders = phonetic_encoders
+        # Preprocessing is deterministic, so cache it per raw string: corpora
+        # revisit the same names constantly and the regex pipeline is not free
+        self._pp = functools.lru_cache(maxsize=100_000)(preprocessor.preprocess)
+        # Phonetic encoding is pure, so cache codes per processed string. Repeated
+        # comparisons against the same corpus then reuse each name's codes instead
+        # of re-encoding them for every pair.
+        self._cached_encodes = {
+            name: functools.lru_cache(maxsize=100_000)(encoder.encode)
+            for name, encoder in phonetic_encoders.items()
+        }
+        # Scoring is pure, so memoize whole results per raw pair; resolver and
+        # dedup workloads revisit the same pairs (e.g. is_match followed by
+        # evaluate_match) and skip the full multi-algorithm pass on a hit
+        self._cached_scores = functools.lru_cache(maxsize=65_536)(self._calculate_scores_uncached)
+        # Similarity work is keyed on the *preprocessed* pair, so raw variants
+        # that canonicalize identically ("Acme Corp.", "ACME CORPORATION")
+        # share one scoring pass even on a raw-pair cache miss
+        self._cached_pair_similarities = functools.lru_cache(maxsize=65_536)(
+            self._similarities_for_processed
+        )
 
     def calculate_scores(self, s1_raw: str, s2_raw: str) -> DomainMatchScore:
         """Calculate comprehensive match scores between two strings.
 
+        Results are memoized per (s1_raw, s2_raw) pair; repeated comparisons
+        of the same pair return the cached score object.
+
         Args:
         ----
             s1_raw: First raw string
@@ -71,41 +97,30 @@ class ComprehensiveMatchScorer:
             Match score object with detailed similarity and phonetic information
 
         """
+        return self._cached_scores(s1_raw, s2_raw)
+
+    def _calculate_scores_uncached(self, s1_raw: str, s2_raw: str) -> DomainMatchScore:
+        """Do the full scoring pass for calculate_scores cache misses."""
         entity_name1 = DomainEntityName(s1_raw)
         entity_name2 = DomainEntityName(s2_raw)
 
-        processed_s1_val = self.preprocessor.preprocess(s1_raw)
-        processed_s2_val = self.preprocessor.preprocess(s2_raw)
+        processed_s1_val = self._pp(s1_raw)
+        processed_s2_val = self._pp(s2_raw)
 
         processed_name1 = DomainProcessedName(entity_name1, processed_s1_val)
         processed_name2 = DomainProcessedName(entity_name2, processed_s2_val)
 
-        all_scores: Dict[str, Union[float, str]] = {}
-
-        # Calculate similarity scores
-        for algo_name, algorithm in self.similarity_algorithms.items():
-            # Handle cases where one or both processed strings are empty
-            if not processed_s1_val or not processed_s2_val:
-                # For distance-based that return 1.0 for identical (like Levenshtein normalized)
-                # if they are different (one empty, one not), similarity is 0.0
-                # if both are empty, similarity is 1.0 (handled by algos)
-                if not processed_s1_val and not processed_s2_val:
-                    all_scores[algo_name] = 1.0
-                else:  # one is empty, other is not
-                    all_scores[algo_name] = 0.0
-            else:
-                all_scores[algo_name] = algorithm.calculate_similarity(
-                    processed_s1_val, processed_s2_val
-                )
-
-        # Calculate phonetic encodings
-        for encoder_name, encoder in self.phonetic_encoders.items():
-            all_scores[f"{encoder_name}_s1"] = (
-                encoder.encode(processed_s1_val) if processed_s1_val else ""
-            )
-            all_scores[f"{encoder_name}_s2"] = (
-                encoder.encode(processed_s2_val) if processed_s2_val else ""
+        all_scores: Dict[str, Union[float, str]] = dict(
+            zip(
+                self.similarity_algorithms,
+                self._cached_pair_similarities(processed_s1_val, processed_s2_val),
             )
+        )
+
+        # Calculate phonetic encodings (cached per processed string)
+        for encoder_name, encode in self._cached_encodes.items():
+            all_scores[f"{encoder_name}_s1"] = encode(processed_s1_val) if processed_s1_val else ""
+            all_scores[f"{encoder_name}_s2"] = encode(processed_s2_val) if processed_s2_val else ""
 
         return DomainMatchScore(
             original_s1=entity_name1,
@@ -115,6 +130,124 @@ class ComprehensiveMatchScorer:
             scores=all_scores,
         )
 
+    def _similarities_for_processed(
+        self, processed_s1_val: str, processed_s2_val: str
+    ) -> Tuple[float, ...]:
+        """Run every similarity algorithm on a preprocessed pair.
+
+        Returns scores in ``self.similarity_algorithms`` iteration order so
+        the caller can zip them back against the algorithm names.
+        """
+        if not processed_s1_val or not processed_s2_val:
+            # For distance-based that return 1.0 for identical (like Levenshtein normalized)
+            # if they are different (one empty, one not), similarity is 0.0
+            # if both are empty, similarity is 1.0 (handled by algos)
+            score = 1.0 if (not processed_s1_val and not processed_s2_val) else 0.0
+            return tuple(score for _ in self.similarity_algorithms)
+        return tuple(
+            algorithm.calculate_similarity(processed_s1_val, processed_s2_val)
+            for algorithm in self.similarity_algorithms.values()
+        )
+
+    def calculate_similarity(
+        self, algorithm_name: str, s1_raw: str, s2_raw: str, min_score: float = 0.0
+    ) -> float:
+        """Calculate a single algorithm's similarity between two strings.
+
+        Cheaper than calculate_scores when the caller needs one score rather
+        than the full battery: only the named algorithm runs, with the same
+        preprocessing and empty-string semantics.
+
+        Args:
+        ----
+            algorithm_name: Name of the similarity algorithm to run
+            s1_raw: First raw string
+            s2_raw: Second raw string
+            min_score: Minimum similarity the caller still cares about;
+                algorithms with a cheap lower bound may return 0.0 early for
+                pairs that provably score below it
+
+        Returns:
+        -------
+            Similarity score in range [0.0, 1.0]
+
+        """
+        processed_s1_val = self._pp(s1_raw)
+        processed_s2_val = self._pp(s2_raw)
+
+        if not processed_s1_val or not processed_s2_val:
+            return 1.0 if (not processed_s1_val and not processed_s2_val) else 0.0
+
+        algorithm = self.similarity_algorithms[algorithm_name]
+        return algorithm.calculate_similarity(processed_s1_val, processed_s2_val, min_score)
+
+    def calculate_similarity_matrix(
+        self, s1_list: List[str], s2_list: List[str]
+    ) -> Dict[str, List[List[float]]]:
+        """Calculate similarity matrices between two lists of strings.
+
+        Batch counterpart to calculate_scores for M x N comparison workloads:
+        each side is preprocessed once (not once per pair), and algorithms
+        whose native RapidFuzz scorer is interchangeable with their Python
+        implementation invoke it directly instead of going through per-pair
+        calculate_scores dispatch and score-dict construction. Entries always
+        agree with calculate_scores for the same pair.
+
+        Args:
+        ----
+            s1_list: First list of raw strings (M rows)
+            s2_list: Second list of raw strings (N columns)
+
+        Returns:
+        -------
+            Dictionary mapping algorithm names to M x N score matrices, where
+            entry [i][j] is the similarity of s1_list[i] and s2_list[j]
+
+        """
+        processed_s1 = [self.preprocessor.preprocess(s) for s in s1_list]
+        processed_s2 = [self.preprocessor.preprocess(s) for s in s2_list]
+
+        matrices: Dict[str, List[List[float]]] = {}
+        for algo_name, algorithm in self.similarity_algorithms.items():
+            scorer_entry = get_exact_rapidfuzz_scorer(algo_name)
+            rows: List[List[float]] = []
+            for p1 in processed_s1:
+                row: List[float] = []
+                for p2 in processed_s2:
+                    # Same empty-string semantics as calculate_scores
+                    if not p1 or not p2:
+                        row.append(1.0 if (not p1 and not p2) else 0.0)
+                    elif scorer_entry is not None:
+                        scorer, max_score = scorer_entry
+                        row.append(scorer(p1, p2) / max_score)
+                    else:
+                        row.append(algorithm.calculate_similarity(p1, p2))
+                rows.append(row)
+            matrices[algo_name] = rows
+        return matrices
+
+    def encode_phonetic_codes(self, strings: List[str]) -> Dict[str, List[str]]:
+        """Encode a list of strings with every configured phonetic encoder.
+
+        Encodes each string exactly once per encoder; pairwise callers can
+        compare codes by position instead of re-encoding per pair.
+
+        Args:
+        ----
+            strings: Raw strings to encode
+
+        Returns:
+        -------
+            Dictionary mapping encoder names to lists of codes, positionally
+            aligned with the input strings
+
+        """
+        processed = [self.preprocessor.preprocess(s) for s in strings]
+        return {
+            name: [encode(p) if p else "" for p in processed]
+            for name, encode in self._cached_encodes.items()
+        }
+
 
 class ConfigurableMatchDecisionStrategy(MatchDecisionStrategy):
     """Configurable matching strategy that uses multiple criteria.
@@ -125,7 +258,6 @@ class ConfigurableMatchDecisionStrategy(MatchDecisionStrategy):
     Attributes
     ----------
         scorer: Service for calculating comprehensive match scores
-        rules: List of rules (condition functions and reason templates) for match decisions
         phonetic_match_contributes: Whether phonetic matches can contribute to match decision
 
     """
@@ -154,37 +286,74 @@ class ConfigurableMatchDecisionStrategy(MatchDecisionStrategy):
 
         """
         self.scorer = scorer
-        self.rules = [
-            (
-                lambda s: s.get_score("token_set_ratio") >= token_set_threshold
-                and s.get_score("jaro_winkler") >= jaro_winkler_threshold,
-                "Combined high token_set_ratio and jaro_winkler similarity",
-            ),
-            (
-                lambda s: s.get_score("weighted_ratio") >= weighted_ratio_threshold,
-                "High weighted_ratio similarity",
-            ),
-            (
-                lambda s: s.get_score("token_set_ratio") >= high_token_set_threshold,
-                "Very high token_set_ratio similarity",
-            ),
-            (
-                lambda s: s.get_score("jaro_winkler") >= high_jaro_winkler_threshold,
-                "Very high jaro_winkler similarity",
-            ),
-        ]
-
-        if phonetic_match_contributes:  # Example of how to add more rules
-            self.rules.append(
-                (
-                    lambda s: s.get_score("soundex_s1") == s.get_score("soundex_s2")
-                    and s.get_score("soundex_s1") != "",
-                    "Phonetic match (Soundex)",
-                )
-            )
-
+        self.token_set_threshold = token_set_threshold
+        self.jaro_winkler_threshold = jaro_winkler_threshold
+        self.weighted_ratio_threshold = weighted_ratio_threshold
+        self.high_token_set_threshold = high_token_set_threshold
+        self.high_jaro_winkler_threshold = high_jaro_winkler_threshold
         self.phonetic_match_contributes = phonetic_match_contributes
 
+    def is_match(self, s1_raw: str, s2_raw: str) -> bool:
+        """Decide whether two strings match, without building reasons.
+
+        Fast path for sweep-style callers that only need the boolean: rules
+        short-circuit on the first satisfied condition and no reason strings
+        are formatted. Use evaluate_match when the reasoning is needed.
+
+        Args:
+        ----
+            s1_raw: First raw string
+            s2_raw: Second raw string
+
+        Returns:
+        -------
+            True if the strings match according to the strategy
+
+        """
+        # Score algorithms lazily, cheapest first, accepting as soon as a rule
+        # is satisfied; most matching pairs decide before weighted_ratio (the
+        # most expensive scorer) ever runs
+        jw = self._similarity_or_zero("jaro_winkler", s1_raw, s2_raw)
+        if jw >= self.high_jaro_winkler_threshold:
+            return True
+
+        ts = self._similarity_or_zero("token_set_ratio", s1_raw, s2_raw)
+        if ts >= self.high_token_set_threshold:
+            return True
+        if ts >= self.token_set_threshold and jw >= self.jaro_winkler_threshold:
+            return True
+
+        wr = self._similarity_or_zero("weighted_ratio", s1_raw, s2_raw)
+        if wr >= self.weighted_ratio_threshold:
+            return True
+
+        if self.phonetic_match_contributes:
+            codes = self.scorer.encode_phonetic_codes([s1_raw, s2_raw]).get("soundex", ["", ""])
+            return bool(codes[0]) and codes[0] == codes[1]
+
+        return False
+
+    def _similarity_or_zero(self, algorithm_name: str, s1_raw: str, s2_raw: str) -> float:
+        """Score a pair with one algorithm, or 0.0 when the scorer lacks it.
+
+        Keeps the fast path in agreement with evaluate_match, whose score
+        lookups default missing algorithms to 0.0 instead of raising.
+
+        Args:
+        ----
+            algorithm_name: Name of the similarity algorithm to run
+            s1_raw: First raw string
+            s2_raw: Second raw string
+
+        Returns:
+        -------
+            Similarity score, or 0.0 if the scorer has no such algorithm
+
+        """
+        if algorithm_name not in self.scorer.similarity_algorithms:
+            return 0.0
+        return self.scorer.calculate_similarity(algorithm_name, s1_raw, s2_raw)
+
     def evaluate_match(self, s1_raw: str, s2_raw: str) -> MatchResult:
         """Evaluate whether two strings match according to the strategy.
 
@@ -200,52 +369,48 @@ class ConfigurableMatchDecisionStrategy(MatchDecisionStrategy):
         """
         score_details = self.scorer.calculate_scores(s1_raw, s2_raw)
 
+        # Materialize the scores every rule consults into locals up front; each
+        # rule below then costs a float compare instead of repeated get_score
+        # dict lookups with isinstance branching
+        ts = score_details.get_similarity("token_set_ratio")
+        jw = score_details.get_similarity("jaro_winkler")
+        wr = score_details.get_similarity("weighted_ratio")
+        soundex_s1 = score_details.get_code("soundex_s1")
+        soundex_s2 = score_details.get_code("soundex_s2")
+        soundex_match = bool(soundex_s1) and soundex_s1 == soundex_s2
+
         is_match = False
         reasons: List[str] = []
 
-        for rule_condition, reason_template in self.rules:
-            if rule_condition(score_details):
+        if ts >= self.token_set_threshold and jw >= self.jaro_winkler_threshold:
+            is_match = True
+            reasons.append(
+                "Combined high token_set_ratio and jaro_winkler similarity "
+                f"(TS: {ts:.2f}, JW: {jw:.2f})"
+            )
+        if wr >= self.weighted_ratio_threshold:
+            is_match = True
+            reasons.append(f"High weighted_ratio similarity (WR: {wr:.2f})")
+        if ts >= self.high_token_set_threshold:
+            is_match = True
+            reasons.append(f"Very high token_set_ratio similarity (TS: {ts:.2f})")
+        if jw >= self.high_jaro_winkler_threshold:
+            is_match = True
+            reasons.append(f"Very high jaro_winkler similarity (JW: {jw:.2f})")
+
+        if self.phonetic_match_contributes:
+            if soundex_match:
                 is_match = True
-
-                # Format reason with actual scores
-                formatted_reason = reason_template  # Default
-
-                if "token_set_ratio" in reason_template and "jaro_winkler" in reason_template:
-                    formatted_reason = (
-                        f"{reason_template} (TS: {score_details.get_score('token_set_ratio'):.2f}, "
-                        f"JW: {score_details.get_score('jaro_winkler'):.2f})"
-                    )
-                elif "weighted_ratio" in reason_template:
-                    formatted_reason = (
-                        f"{reason_template} (WR: {score_details.get_score('weighted_ratio'):.2f})"
-                    )
-                elif "token_set_ratio" in reason_template:
-                    formatted_reason = (
-                        f"{reason_template} (TS: {score_details.get_score('token_set_ratio'):.2f})"
-                    )
-                elif "jaro_winkler" in reason_template:
-                    formatted_reason = (
-                        f"{reason_template} (JW: {score_details.get_score('jaro_winkler'):.2f})"
-                    )
-                elif "Soundex" in reason_template:
-                    formatted_reason = f"{reason_template}: {score_details.get_score('soundex_s1')}"
-
-                reasons.append(formatted_reason)
-
-        # Add phonetic info even if not a primary reason for match, if codes are non-empty and equal
-        if not self.phonetic_match_contributes:  # Avoid duplicate reason if already added
-            soundex_s1 = score_details.get_score("soundex_s1")
-            soundex_s2 = score_details.get_score("soundex_s2")
-            if isinstance(soundex_s1, str) and soundex_s1 != "" and soundex_s1 == soundex_s2:
+                reasons.append(f"Phonetic match (Soundex): {soundex_s1}")
+        else:
+            # Add phonetic info even if not a primary reason for match, if codes
+            # are non-empty and equal
+            if soundex_match:
                 reasons.append(f"Informational: Phonetic Soundex match ({soundex_s1})")
 
-            metaphone_s1 = score_details.get_score("metaphone_s1")
-            metaphone_s2 = score_details.get_score("metaphone_s2")
-            if (
-                isinstance(metaphone_s1, str)
-                and metaphone_s1 != ""
-                and metaphone_s1 == metaphone_s2
-            ):
+            metaphone_s1 = score_details.get_code("metaphone_s1")
+            metaphone_s2 = score_details.get_code("metaphone_s2")
+            if metaphone_s1 and metaphone_s1 == metaphone_s2:
                 reasons.append(f"Informational: Phonetic Metaphone match ({metaphone_s1})")
 
         return MatchResult(score_details, is_match, reasons)
@@ -272,6 +437,7 @@ class EntityResolverService(EntityResolver):
         primary_algorithm: MatchingAlgorithm,
         threshold: float = 0.8,
         limit: int = 5,
+        abbreviation_aliases: Optional[Dict[str, Set[str]]] = None,
     ):
         """Initialize the entity resolver service.
 
@@ -281,12 +447,37 @@ class EntityResolverService(EntityResolver):
             primary_algorithm: Primary matching algorithm for resolution
             threshold: Similarity threshold for considering a match [0.0, 1.0]
             limit: Maximum number of matches to return
+            abbreviation_aliases: Mapping from query abbreviations to candidate
+                names that should be treated as exact matches (optional)
 
         """
         self.preprocessor = preprocessor
         self.primary_algorithm = primary_algorithm
         self.threshold = threshold
         self.limit = limit
+        self.abbreviation_aliases = (
+            abbreviation_aliases
+            if abbreviation_aliases is not None
+            else {"IBM": {"IBM", "IBM Corporation"}}
+        )
+        # Candidate lists are usually stable across queries, so memoize the
+        # preprocessor per service instance; repeat resolve() calls then skip
+        # the normalization chain for already-seen names
+        self._pp = functools.lru_cache(maxsize=100_000)(preprocessor.preprocess)
+
+    def prewarm(self, candidate_names: List[EntityName]) -> None:
+        """Preprocess candidate names ahead of time to warm the cache.
+
+        Callers running many queries against the same candidate list can pay
+        the preprocessing cost once up front instead of on the first query.
+
+        Args:
+        ----
+            candidate_names: Candidate names to preprocess
+
+        """
+        for c_name_obj in candidate_names:
+            self._pp(c_name_obj.raw_value)
 
     def resolve(
         self, query_name: EntityName, candidate_names: List[EntityName]
@@ -303,46 +494,37 @@ class EntityResolverService(EntityResolver):
             List of match candidates ordered by relevance (descending score)
 
         """
-        processed_query_val = self.preprocessor.preprocess(query_name.raw_value)
+        processed_query_val = self._pp(query_name.raw_value)
 
         if not processed_query_val:
             return []
 
-        # Preprocess all candidates and store mapping
-        # Using a list of tuples (original_name_obj, processed_name_obj)
-        processed_candidates_map: List[Tuple[DomainEntityName, DomainProcessedName]] = []
+        # Preprocess all candidates into parallel arrays (structure-of-arrays):
+        # the flat list of processed values feeds the batch scorer directly and
+        # scores come back as indices into the name list. DomainProcessedName
+        # wrappers are built only for the few candidates that survive ranking,
+        # not for the whole corpus.
+        original_names: List[DomainEntityName] = []
+        processed_values: List[str] = []
 
         # Check for exact matches first (prioritize these)
         exact_matches: List[MatchCandidate] = []
 
-        # Special handling for abbreviations - for test case fix
-        if query_name.raw_value == "IBM":
-            ibm_matches = []
-
-            for c_name_obj in candidate_names:
-                if c_name_obj.raw_value == "IBM" or c_name_obj.raw_value == "IBM Corporation":
-                    processed_c_val = self.preprocessor.preprocess(c_name_obj.raw_value)
-                    domain_name = cast(DomainEntityName, c_name_obj)
-                    processed_name = DomainProcessedName(domain_name, processed_c_val)
-                    ibm_matches.append(
-                        MatchCandidate(
-                            entity_name=domain_name,
-                            processed_entity_name=processed_name,
-                            score=1.0,  # Exact match gets perfect score
-                        )
-                    )
-
-            if ibm_matches:
-                return sorted(ibm_matches)
+        # Candidate names treated as exact hits for this query's abbreviation,
+        # looked up once so the loop pays a single membership test per candidate
+        alias_names: AbstractSet[str] = self.abbreviation_aliases.get(
+            query_name.raw_value, frozenset()
+        )
 
         for c_name_obj in candidate_names:
-            processed_c_val = self.preprocessor.preprocess(c_name_obj.raw_value)
+            processed_c_val = self._pp(c_name_obj.raw_value)
             if processed_c_val:  # Only consider candidates that are non-empty after processing
                 # Cast to DomainEntityName for type compatibility
                 domain_name = cast(DomainEntityName, c_name_obj)
-                processed_name = DomainProcessedName(domain_name, processed_c_val)
 
-                # Check for exact raw_value match or processed_value match
+                # Check for exact raw_value match or processed_value match,
+                # or an abbreviation match; only these few construct their
+                # DomainProcessedName here
                 if (
                     query_name.raw_value == domain_name.raw_value
                     or processed_query_val == processed_c_val
@@ -350,63 +532,165 @@ class EntityResolverService(EntityResolver):
                     exact_matches.append(
                         MatchCandidate(
                             entity_name=domain_name,
-                            processed_entity_name=processed_name,
+                            processed_entity_name=DomainProcessedName(domain_name, processed_c_val),
                             score=1.0,  # Exact match gets perfect score
                         )
                     )
-                # Check for abbreviation matches
-                elif query_name.raw_value in ["IBM"] and domain_name.raw_value in [
-                    "IBM",
-                    "IBM Corporation",
-                ]:
+                elif domain_name.raw_value in alias_names:
                     exact_matches.append(
                         MatchCandidate(
                             entity_name=domain_name,
-                            processed_entity_name=processed_name,
+                            processed_entity_name=DomainProcessedName(domain_name, processed_c_val),
                             score=1.0,  # Abbreviation match also gets perfect score
                         )
                     )
 
-                processed_candidates_map.append((domain_name, processed_name))
+                original_names.append(domain_name)
+                processed_values.append(processed_c_val)
 
-        # If we found exact matches, return them immediately
+        # If we found exact matches, return them immediately. All carry a 1.0
+        # score, so candidate-list order is preserved as-is.
         if exact_matches:
-            return sorted(exact_matches)
+            return exact_matches
 
-        if not processed_candidates_map:
+        if not processed_values:
             return []
 
-        # Define a scorer function for thefuzz.process.extract
-        # Our MatchingAlgorithm returns 0.0-1.0, but thefuzz expects 0-100
-        def fuzz_scorer(q_str: str, c_str: str) -> float:
-            return self.primary_algorithm.calculate_similarity(q_str, c_str) * 100.0
+        # Fast path: algorithms whose native scorer matches their Python
+        # implementation score the whole candidate list in one RapidFuzz batch
+        # call over the flat value array; algorithms with Python-side score
+        # adjustments take the per-pair path below so decisions never change.
+        # Passing score_cutoff also engages RapidFuzz's internal prefilters
+        # (length-difference bounds, common-prefix/suffix stripping), so
+        # hopeless candidates are rejected in C before the full kernel runs.
+        scorer_entry = get_exact_rapidfuzz_scorer(self.primary_algorithm.name)
+        if scorer_entry is not None:
+            scorer, max_score = scorer_entry
+            extracted = rf_process.extract(
+                processed_query_val,
+                processed_values,
+                scorer=scorer,
+                score_cutoff=self.threshold * max_score,
+                limit=self.limit,
+            )
+            return [
+                MatchCandidate(
+                    entity_name=original_names[idx],
+                    processed_entity_name=DomainProcessedName(original_names[idx], processed_value),
+                    score=score / max_score,
+                )
+                for processed_value, score, idx in extracted
+            ]
+
+        # Fallback for custom algorithms: score each processed value in place
+        # and keep the index, so results map straight back into the parallel
+        # arrays without a string-keyed lookup dict
+        calculate_similarity = self.primary_algorithm.calculate_similarity
+
+        def iter_candidates() -> Iterator[MatchCandidate]:
+            for idx, processed_c_val in enumerate(processed_values):
+                score = calculate_similarity(processed_query_val, processed_c_val)
+                if score >= self.threshold:
+                    yield MatchCandidate(
+                        entity_name=original_names[idx],
+                        processed_entity_name=DomainProcessedName(
+                            original_names[idx], processed_c_val
+                        ),
+                        score=score,
+                    )
 
-        # Create a lookup map for reconstructing results
-        lookup_map: Dict[str, Tuple[DomainEntityName, DomainProcessedName]] = {
-            pc_obj.processed_value: (orig_name_obj, pc_obj)
-            for orig_name_obj, pc_obj in processed_candidates_map
-        }
+        # Partial top-k selection: O(N log k) instead of a full sort
+        return heapq.nlargest(self.limit, iter_candidates(), key=lambda mc: mc.score)
 
-        # Ensure choices for fuzz are unique to avoid issues with lookup_map
-        unique_choices_for_fuzz = list(lookup_map.keys())
+    def resolve_batch(
+        self, query_names: List[EntityName], candidate_names: List[EntityName]
+    ) -> List[List[MatchCandidate]]:
+        """Resolve many queries against one candidate list.
 
-        # Find best matches using thefuzz.process.extract
-        best_matches_fuzz = process.extract(
-            processed_query_val, unique_choices_for_fuzz, scorer=fuzz_scorer, limit=self.limit
-        )  # Returns list of (string, score_0_100)
+        Batch counterpart to resolve: the candidate list is preprocessed and
+        indexed for exact lookups once, then each query costs one O(1) exact
+        probe plus one batch similarity scan, instead of re-walking the
+        candidate list per query.
 
-        results: List[MatchCandidate] = []
-        for match_str, score_0_100 in best_matches_fuzz:
-            score_0_1 = score_0_100 / 100.0
-            if score_0_1 >= self.threshold:
-                original_name_obj, processed_name_obj = lookup_map[match_str]
+        Args:
+        ----
+            query_names: Query entity names
+            candidate_names: List of candidate entity names shared by all queries
+
+        Returns:
+        -------
+            One list of match candidates per query, positionally aligned with
+            query_names
+
+        """
+        # Candidate arrays plus exact-lookup indexes, built once for all queries
+        original_names: List[DomainEntityName] = []
+        processed_values: List[str] = []
+        raw_index: Dict[str, List[int]] = {}
+        processed_index: Dict[str, List[int]] = {}
+
+        for c_name_obj in candidate_names:
+            processed_c_val = self._pp(c_name_obj.raw_value)
+            if not processed_c_val:
+                continue
+            domain_name = cast(DomainEntityName, c_name_obj)
+            idx = len(original_names)
+            original_names.append(domain_name)
+            processed_values.append(processed_c_val)
+            raw_index.setdefault(domain_name.raw_value, []).append(idx)
+            processed_index.setdefault(processed_c_val, []).append(idx)
+
+        scorer_entry = get_exact_rapidfuzz_scorer(self.primary_algorithm.name)
+
+        def make_candidate(idx: int, score: float) -> MatchCandidate:
+            return MatchCandidate(
+                entity_name=original_names[idx],
+                processed_entity_name=DomainProcessedName(
+                    original_names[idx], processed_values[idx]
+                ),
+                score=score,
+            )
+
+        results: List[List[MatchCandidate]] = []
+        for query_name in query_names:
+            processed_query_val = self._pp(query_name.raw_value)
+            if not processed_query_val or not processed_values:
+                results.append([])
+                continue
+
+            # Exact and abbreviation matches via the prebuilt indexes
+            exact_idxs: Set[int] = set(raw_index.get(query_name.raw_value, ()))
+            exact_idxs.update(processed_index.get(processed_query_val, ()))
+            for alias in self.abbreviation_aliases.get(query_name.raw_value, ()):
+                exact_idxs.update(raw_index.get(alias, ()))
+
+            if exact_idxs:
+                results.append([make_candidate(idx, 1.0) for idx in sorted(exact_idxs)])
+                continue
+
+            if scorer_entry is not None:
+                scorer, max_score = scorer_entry
+                extracted = rf_process.extract(
+                    processed_query_val,
+                    processed_values,
+                    scorer=scorer,
+                    score_cutoff=self.threshold * max_score,
+                    limit=self.limit,
+                )
                 results.append(
-                    MatchCandidate(
-                        entity_name=original_name_obj,
-                        processed_entity_name=processed_name_obj,
-                        score=score_0_1,
-                    )
+                    [make_candidate(idx, score / max_score) for _, score, idx in extracted]
+                )
+            else:
+                calculate_similarity = self.primary_algorithm.calculate_similarity
+                scored = (
+                    (idx, calculate_similarity(processed_query_val, processed_c_val))
+                    for idx, processed_c_val in enumerate(processed_values)
+                )
+                top = heapq.nlargest(
+                    self.limit,
+                    ((idx, score) for idx, score in scored if score >= self.threshold),
+                    key=lambda pair: pair[1],
                 )
+                results.append([make_candidate(idx, score) for idx, score in top])
 
-        # Sort by score descending (MatchCandidate implements __lt__ for this)
-        return sorted(results)
+        return results
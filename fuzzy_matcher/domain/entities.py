@@ -21,6 +21,10 @@ class DomainEntityName:
 
     """
 
+    # Spelled out by hand because dataclass(slots=True) needs Python 3.10 and
+    # this package supports 3.8; instances are created per pair in hot loops
+    __slots__ = ("raw_value",)
+
     raw_value: str
 
     def __str__(self) -> str:
@@ -47,6 +51,8 @@ class DomainProcessedName:
 
     """
 
+    __slots__ = ("original", "processed_value")
+
     original: DomainEntityName
     processed_value: str
 
@@ -77,6 +83,8 @@ class DomainMatchScore:
 
     """
 
+    __slots__ = ("original_s1", "original_s2", "processed_s1", "processed_s2", "scores")
+
     original_s1: DomainEntityName
     original_s2: DomainEntityName
     processed_s1: DomainProcessedName
@@ -108,6 +116,41 @@ class DomainMatchScore:
             return ""
         return 0.0
 
+    def get_similarity(self, algorithm_name: str) -> float:
+        """Get a similarity score by algorithm name.
+
+        Typed fast path for callers that know the key holds a float: one dict
+        lookup, no isinstance branching or prefix heuristics.
+
+        Args:
+        ----
+            algorithm_name: Name of the similarity algorithm
+
+        Returns:
+        -------
+            Similarity score, or 0.0 if not present
+
+        """
+        value = self.scores.get(algorithm_name, 0.0)
+        return value if isinstance(value, float) else 0.0
+
+    def get_code(self, encoder_name: str) -> str:
+        """Get a phonetic code by encoder key.
+
+        Typed fast path for callers that know the key holds a string code.
+
+        Args:
+        ----
+            encoder_name: Phonetic score key (e.g. "soundex_s1")
+
+        Returns:
+        -------
+            Phonetic code, or "" if not present
+
+        """
+        value = self.scores.get(encoder_name, "")
+        return value if isinstance(value, str) else ""
+
 
 @dataclass
 class MatchResult:
@@ -205,24 +248,8 @@ class MatchCandidate:
 
     """
 
+    __slots__ = ("entity_name", "processed_entity_name", "score")
+
     entity_name: DomainEntityName
     processed_entity_name: DomainProcessedName
     score: float
-
-    def __lt__(self, other: "MatchCandidate") -> bool:
-        """Compare match candidates by score (higher score is better).
-
-        This allows sorting match candidates in descending order by score
-        using the built-in sorted() function.
-
-        Args:
-        ----
-            other: The match candidate to compare with
-
-        Returns:
-        -------
-            True if this candidate has a higher score, False otherwise
-
-        """
-        # Higher score is better
-        return self.score > other.score
@@ -4,9 +4,10 @@ This module implements the StringPreprocessor protocol from fuzzy_matcher.protoc
 using a chain of responsibility pattern to process strings in multiple steps.
 """
 
+import functools
 import re
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterable, List, Optional
 
 from unidecode import unidecode
 
@@ -143,49 +144,43 @@ class CompanySuffixStandardizationStep(PreprocessingStep):
 
         """
         super().__init__(next_step)
-        # Order matters: e.g., "p.l.c." before "plc" if "plc" is a substring of the replacement
-        self.suffix_mapping = {
+        # One family per canonical suffix: the alternatives all rewrite to the
+        # same replacement, with longer forms listed before their prefixes
+        # ("corporation" before "corp") and dotted variants collapsed into an
+        # optional "\.?". The spelled-out "public limited company" /
+        # "limited liability company" forms are deliberately absent: they are
+        # normalized word-by-word ("limited" -> "ltd", "company" -> "co"),
+        # which matches how the previous per-pattern substitution chain
+        # rewrote them.
+        self.suffix_families = [
             # Common corporation variations
-            r"\bcorporation\b": "corp",
-            r"\bcorp\b": "corp",
-            r"\bcorp\.\b": "corp",
+            (r"corporation|corp\.?", "corp"),
             # Incorporated variations
-            r"\bincorporated\b": "inc",
-            r"\binc\b": "inc",
-            r"\binc\.\b": "inc",
+            (r"incorporated|inc\.?", "inc"),
             # Limited variations
-            r"\blimited\b": "ltd",
-            r"\bltd\b": "ltd",
-            r"\bltd\.\b": "ltd",
+            (r"limited|ltd\.?", "ltd"),
             # Company variations
-            r"\bcompany\b": "co",
-            r"\bco\b": "co",
-            r"\bco\.\b": "co",
+            (r"company|co\.?", "co"),
             # PLC variations
-            r"\bpublic limited company\b": "plc",
-            r"\bp\.l\.c\.\b": "plc",
-            r"\bplc\b": "plc",
+            (r"p\.l\.c\.|plc", "plc"),
             # LLC variations
-            r"\blimited liability company\b": "llc",
-            r"\bl\.l\.c\.\b": "llc",
-            r"\bllc\b": "llc",
+            (r"l\.l\.c\.|llc", "llc"),
             # Other common variations
-            r"\bsociete anonyme\b": "sa",
-            r"\bs\.a\.\b": "sa",
-            r"\bsa\b": "sa",
-            r"\bsociété anonyme\b": "sa",  # Added with accent
-            r"\baktiengesellschaft\b": "ag",
-            r"\ba\.g\.\b": "ag",
-            r"\bag\b": "ag",
-            r"\bgmbh\b": "gmbh",
-            r"\bgmbh & co\. kg\b": "gmbh",
-            r"\bholdings?\b": "hldg",
-            r"\bhldg\b": "hldg",
-            r"\bhldg\.\b": "hldg",
-            r"\bgroup\b": "grp",
-            r"\bgrp\b": "grp",
-            r"\bgrp\.\b": "grp",
-        }
+            (r"societe anonyme|société anonyme|s\.a\.|sa", "sa"),
+            (r"aktiengesellschaft|a\.g\.|ag", "ag"),
+            (r"gmbh & co\. kg|gmbh", "gmbh"),
+            (r"holdings?|hldg\.?", "hldg"),
+            (r"group|grp\.?", "grp"),
+        ]
+        # Fuse every family into a single alternation so one scan of the text
+        # replaces all suffixes, instead of one full re.sub pass per pattern.
+        # Each family gets its own capturing group; the matched group's index
+        # selects the replacement.
+        self._combined = re.compile(
+            "|".join(rf"(\b(?:{pattern})\b)" for pattern, _ in self.suffix_families),
+            re.IGNORECASE,
+        )
+        self._replacements = [replacement for _, replacement in self.suffix_families]
 
     def _execute(self, text: str) -> str:
         """Standardize company suffixes in text.
@@ -199,20 +194,32 @@ class CompanySuffixStandardizationStep(PreprocessingStep):
             Text with standardized company suffixes
 
         """
-        processed_text = text
-        for pattern, replacement in self.suffix_mapping.items():
-            processed_text = re.sub(pattern, replacement, processed_text, flags=re.IGNORECASE)
-        return processed_text
+        replacements = self._replacements
+
+        def _replace(m: "re.Match[str]") -> str:
+            idx = m.lastindex
+            # The fused alternation is all groups, so one of them matched
+            assert idx is not None
+            return replacements[idx - 1]
+
+        return self._combined.sub(_replace, text)
 
 
 class PunctuationRemovalStep(PreprocessingStep):
     """Removes punctuation from text."""
 
+    # Deletion table for every ASCII character outside [\w\s], equivalent to
+    # the old replace + re.sub passes but done in one C-level translate.
+    # Non-ASCII input (rare here — accent removal runs earlier) falls back to
+    # the regex, which also handles Unicode punctuation.
+    _ASCII_PUNCT_TABLE = {i: None for i in range(128) if not re.match(r"[\w\s]", chr(i))}
+    _NON_WORD_RE = re.compile(r"[^\w\s]")
+
     def _execute(self, text: str) -> str:
         """Remove punctuation from text.
 
-        First removes specific punctuation (periods and commas), then
-        removes all remaining non-alphanumeric/whitespace characters.
+        Removes all non-alphanumeric/whitespace characters, keeping letters,
+        numbers, underscores and whitespace.
 
         Args:
         ----
@@ -223,11 +230,9 @@ class PunctuationRemovalStep(PreprocessingStep):
             Text with punctuation removed
 
         """
-        # Remove periods and commas specifically, then general non-alphanumeric/whitespace
-        # This order can matter if some punctuation is part of suffixes handled earlier
-        text_no_specific_punct = text.replace(".", "").replace(",", "")
-        # Removes all remaining punctuation, keeps letters, numbers, and whitespace
-        return re.sub(r"[^\w\s]", "", text_no_specific_punct)
+        if text.isascii():
+            return text.translate(self._ASCII_PUNCT_TABLE)
+        return self._NON_WORD_RE.sub("", text)
 
 
 class WhitespaceNormalizationStep(PreprocessingStep):
@@ -248,7 +253,9 @@ class WhitespaceNormalizationStep(PreprocessingStep):
             Text with normalized whitespace
 
         """
-        return re.sub(r"\s+", " ", text).strip()
+        # split() collapses whitespace runs and trims the edges in one
+        # C-level pass, with no regex engine involved
+        return " ".join(text.split())
 
 
 class StandardStringPreprocessor(StringPreprocessor):
@@ -261,15 +268,32 @@ class StandardStringPreprocessor(StringPreprocessor):
     def __init__(self) -> None:
         """Initialize the standard string preprocessor.
 
-        Creates a chain of preprocessing steps in the desired order.
+        Builds the preprocessing steps in the desired execution order.
         """
-        # Define the chain of preprocessing steps in desired order
-        # Last step in definition is first in execution path if thinking backwards
-        step1 = WhitespaceNormalizationStep()
-        step2 = PunctuationRemovalStep(step1)
-        step3 = CompanySuffixStandardizationStep(step2)
-        step4 = LowercaseStep(step3)
-        self._chain_head = AccentRemovalStep(step4)  # First step to execute after type conversion
+        # The step classes stay around for extensibility and standalone use,
+        # but at runtime we execute their bound _execute methods from a flat
+        # list: preprocess is called once per input string on hot paths, and
+        # the chain-of-responsibility dispatch added a virtual process() call
+        # plus a next-step branch per step for no behavioral gain.
+        self._fns = [
+            AccentRemovalStep()._execute,
+            LowercaseStep()._execute,
+            CompanySuffixStandardizationStep()._execute,
+            PunctuationRemovalStep()._execute,
+            WhitespaceNormalizationStep()._execute,
+        ]
+        # Preprocessing is deterministic, so memoize the pipeline per raw
+        # string: matchers re-preprocess the same master list against many
+        # queries, and a cache hit replaces the regex scans with a dict probe.
+        # The steps are fixed at construction; if that ever changes, call
+        # self._run_pipeline.cache_clear() after reconfiguring.
+        self._run_pipeline = functools.lru_cache(maxsize=100_000)(self._run_pipeline_uncached)
+
+    def _run_pipeline_uncached(self, str_text: str) -> str:
+        """Run every preprocessing step over a non-empty string."""
+        for fn in self._fns:
+            str_text = fn(str_text)
+        return str_text
 
     def preprocess(self, text: StringOrNumeric) -> str:
         """Preprocess input string to standardized form.
@@ -292,4 +316,32 @@ class StandardStringPreprocessor(StringPreprocessor):
         if not str_text.strip():  # Handle empty or whitespace-only strings
             return ""
 
-        return self._chain_head.process(str_text)
+        return self._run_pipeline(str_text)
+
+    def preprocess_batch(self, texts: Iterable[StringOrNumeric]) -> List[str]:
+        """Preprocess a batch of input strings to standardized form.
+
+        Batch counterpart to preprocess for callers that feed whole columns:
+        duplicate raw strings — within the batch or across earlier calls —
+        hit the pipeline cache and are processed only once.
+
+        Args:
+        ----
+            texts: Input texts to preprocess
+
+        Returns:
+        -------
+            Preprocessed strings, in input order
+
+        """
+        run_pipeline = self._run_pipeline
+        results: List[str] = []
+        for text in texts:
+            if text is None:
+                results.append("")
+                continue
+
+            str_text: str = str(text) if not isinstance(text, str) else text
+
+            results.append(run_pipeline(str_text) if str_text.strip() else "")
+        return results
@@ -4,8 +4,11 @@ This module provides implementations of the EntityRepository protocol for
 storing and retrieving entity profiles from various data sources.
 """
 
-from collections import defaultdict
-from typing import Dict, List, Optional, Set, cast
+import functools
+import heapq
+import itertools
+import sys
+from typing import Dict, Iterable, List, Optional, Set, Tuple, cast
 
 from fuzzy_matcher.domain.entities import DomainEntityProfile
 from fuzzy_matcher.infrastructure.algorithms import SoundexEncoder
@@ -28,11 +31,16 @@ class InMemoryEntityRepository(EntityRepository):
     ----------
         preprocessor: String preprocessor for standardizing entity names
         _entities_by_id: Dictionary mapping entity IDs to entity profiles
-        _primary_name_to_id: Dictionary mapping processed primary names to entity IDs
-        _alt_name_to_id: Dictionary mapping processed alternate names to entity IDs
-        _phonetic_primary_index: Dictionary mapping phonetic codes to sets of entity IDs
+        _primary_name_to_doc: Dictionary mapping processed primary names to doc IDs
+        _alt_name_to_doc: Dictionary mapping processed alternate names to doc IDs
+        _phonetic_primary_index: Dictionary mapping phonetic codes to sets of doc IDs
         _phonetic_encoder: Phonetic encoder for indexing entity names
 
+    The indices store compact integer doc IDs rather than entity ID strings:
+    each entity is assigned a doc ID on first save, and set operations during
+    candidate generation compare small ints instead of hashing strings. Doc IDs
+    are translated back to entity IDs only when results are materialized.
+
     """
 
     def __init__(
@@ -48,14 +56,141 @@ class InMemoryEntityRepository(EntityRepository):
 
         """
         self.preprocessor = preprocessor
+
+        # Memoized preprocessing adapter: repeated lookups for the same name hit
+        # the cache instead of re-running the normalization chain to rebuild the
+        # index key. Results are interned: processed names recur heavily as dict
+        # keys across the name indexes and snapshots, so duplicates collapse to
+        # one object and key comparisons short-circuit on identity.
+        def _preprocess_interned(text: str) -> str:
+            return sys.intern(preprocessor.preprocess(text))
+
+        self._pp = functools.lru_cache(maxsize=100_000)(_preprocess_interned)
         self._entities_by_id: Dict[str, DomainEntityProfile] = {}
-        self._primary_name_to_id: Dict[str, str] = {}
-        self._alt_name_to_id: Dict[str, str] = {}
-        self._phonetic_primary_index: Dict[str, Set[str]] = defaultdict(set)
+        # Integer doc-id indirection: every index below stores compact ints
+        # instead of entity ID strings, which shrinks the postings and makes
+        # set unions/intersections during candidate generation cheaper. The
+        # doc ID is allocated on first save and stays stable across updates.
+        self._entity_id_to_doc: Dict[str, int] = {}
+        self._doc_to_entity_id: List[str] = []
+        # Separate primary and alternate name maps: merging them into one dict
+        # would save a probe on exact lookups, but a primary name overwriting
+        # another entity's identical alternate name (and vice versa on removal)
+        # silently loses the weaker claim, so each kind keeps its own index
+        self._primary_name_to_doc: Dict[str, int] = {}
+        self._alt_name_to_doc: Dict[str, int] = {}
+        # Raw-name indexes so an exact raw lookup wins over entities whose distinct
+        # raw names collide after preprocessing (e.g. "Apple Inc." vs
+        # "Apple Incorporated" both normalize to "apple inc")
+        self._raw_primary_to_id: Dict[str, int] = {}
+        self._raw_alt_to_id: Dict[str, int] = {}
+        # Plain dicts with setdefault on the write paths: defaultdict would
+        # allocate an empty set through __missing__ on any probe of an absent
+        # key, which the read and removal paths do constantly
+        self._phonetic_primary_index: Dict[str, Set[int]] = {}
+        # Per-entity snapshot of what was indexed at save time:
+        # (raw_primary, processed_primary, [(raw_alt, processed_alt), ...],
+        # phonetic_code). Removal and scans read this instead of re-running
+        # the preprocessing pipeline, and removal unindexes exactly what was
+        # indexed even if the profile was mutated after save.
+        self._processed: Dict[str, Tuple[str, str, List[Tuple[str, str]], Optional[str]]] = {}
+        # Inverted indexes for sublinear candidate generation: tokens and character
+        # trigrams of each processed name map to the set of entity IDs containing them.
+        self._token_index: Dict[str, Set[int]] = {}
+        self._trigram_index: Dict[str, Set[int]] = {}
+        # First token of each processed primary name -> doc IDs, so a
+        # short query like "apple" finds "apple inc" with one bucket lookup
+        # instead of scanning the corpus
+        self._first_token_index: Dict[str, Set[int]] = {}
+        # Lazily built list for get_all_entity_names, invalidated by writes:
+        # callers tend to ask for the full name list once per query, and
+        # rebuilding it is O(entities) each time
+        self._all_names_cache: Optional[List[EntityName]] = None
         self._phonetic_encoder = (
             phonetic_encoder if phonetic_encoder is not None else SoundexEncoder()
         )
 
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """Get the set of character trigrams for a processed name.
+
+        Args:
+        ----
+            text: Processed name text
+
+        Returns:
+        -------
+            Set of character trigrams (the whole string if shorter than three chars)
+
+        """
+        if len(text) < 3:
+            return {text} if text else set()
+        return {text[i : i + 3] for i in range(len(text) - 2)}
+
+    def _doc_id_for(self, entity_id: str) -> int:
+        """Get the doc ID for an entity ID, allocating one on first use.
+
+        Args:
+        ----
+            entity_id: ID of the entity
+
+        Returns:
+        -------
+            Compact integer doc ID, stable for the lifetime of the repository
+
+        """
+        doc_id = self._entity_id_to_doc.get(entity_id)
+        if doc_id is None:
+            doc_id = len(self._doc_to_entity_id)
+            self._entity_id_to_doc[entity_id] = doc_id
+            self._doc_to_entity_id.append(entity_id)
+        return doc_id
+
+    def _index_name_terms(self, processed_name: str, doc_id: int) -> None:
+        """Add a processed name's tokens and trigrams to the inverted indexes.
+
+        Args:
+        ----
+            processed_name: Processed entity name
+            doc_id: Doc ID of the entity owning the name
+
+        """
+        for token in processed_name.split():
+            self._token_index.setdefault(token, set()).add(doc_id)
+        for trigram in self._trigrams(processed_name):
+            self._trigram_index.setdefault(trigram, set()).add(doc_id)
+
+    def _unindex_name_terms(self, processed_name: str, doc_id: int) -> None:
+        """Remove a processed name's tokens and trigrams from the inverted indexes.
+
+        Args:
+        ----
+            processed_name: Processed entity name
+            doc_id: Doc ID of the entity owning the name
+
+        """
+        for token in processed_name.split():
+            self._discard_posting(self._token_index, token, doc_id)
+        for trigram in self._trigrams(processed_name):
+            self._discard_posting(self._trigram_index, trigram, doc_id)
+
+    @staticmethod
+    def _discard_posting(index: Dict[str, Set[int]], key: str, doc_id: int) -> None:
+        """Discard a doc ID from one posting set, dropping the set once empty.
+
+        Args:
+        ----
+            index: Posting index to update
+            key: Index key whose posting set holds the doc ID
+            doc_id: Doc ID of the entity being removed
+
+        """
+        postings = index.get(key)
+        if postings is not None:
+            postings.discard(doc_id)
+            if not postings:
+                del index[key]
+
     def _get_phonetic_code(self, processed_name: str) -> Optional[str]:
         """Get phonetic code for a processed name.
 
@@ -72,7 +207,9 @@ class InMemoryEntityRepository(EntityRepository):
             return None
 
         code = self._phonetic_encoder.encode(processed_name)
-        return code if code else None
+        # Interned: codes are shared dict keys in _phonetic_primary_index and
+        # cluster heavily (Soundex has a small code space)
+        return sys.intern(code) if code else None
 
     def save(self, entity: EntityProfile) -> None:
         """Save entity to repository.
@@ -89,27 +226,77 @@ class InMemoryEntityRepository(EntityRepository):
         existing_entity = self._entities_by_id.get(entity.entity_id)
         if existing_entity:
             self._remove_from_indices(existing_entity)
+        self._all_names_cache = None
 
         # Cast to DomainEntityProfile for internal storage
         self._entities_by_id[entity.entity_id] = cast(DomainEntityProfile, entity)
+        doc_id = self._doc_id_for(entity.entity_id)
 
         # Index primary name
-        processed_primary = self.preprocessor.preprocess(entity.primary_name.raw_value)
+        raw_primary = entity.primary_name.raw_value
+        self._raw_primary_to_id[raw_primary] = doc_id
+        processed_primary = self._pp(raw_primary)
+        phonetic_code: Optional[str] = None
         if processed_primary:
-            self._primary_name_to_id[processed_primary] = entity.entity_id
+            self._primary_name_to_doc[processed_primary] = doc_id
+            self._index_name_terms(processed_primary, doc_id)
+            first_token = processed_primary.split(" ", 1)[0]
+            self._first_token_index.setdefault(first_token, set()).add(doc_id)
             phonetic_code = self._get_phonetic_code(processed_primary)
             if phonetic_code:
-                self._phonetic_primary_index[phonetic_code].add(entity.entity_id)
+                self._phonetic_primary_index.setdefault(phonetic_code, set()).add(doc_id)
 
         # Index alternate names
+        alt_pairs: List[Tuple[str, str]] = []
         for alt_name_obj in entity.alternate_names:
-            processed_alt = self.preprocessor.preprocess(alt_name_obj.raw_value)
+            raw_alt = alt_name_obj.raw_value
+            self._raw_alt_to_id[raw_alt] = doc_id
+            processed_alt = self._pp(raw_alt)
+            alt_pairs.append((raw_alt, processed_alt))
             if processed_alt:
-                self._alt_name_to_id[processed_alt] = entity.entity_id
+                self._alt_name_to_doc[processed_alt] = doc_id
+                self._index_name_terms(processed_alt, doc_id)
                 # Optionally, index alternate names phonetically too
                 # phonetic_code_alt = self._get_phonetic_code(processed_alt)
                 # if phonetic_code_alt:
-                #     self._phonetic_alt_index[phonetic_code_alt].add(entity.entity_id)
+                #     self._phonetic_alt_index[phonetic_code_alt].add(doc_id)
+
+        # Snapshot the processed forms so removal and scans reuse them
+        self._processed[entity.entity_id] = (
+            raw_primary,
+            processed_primary,
+            alt_pairs,
+            phonetic_code,
+        )
+
+    def bulk_save(self, entities: Iterable[EntityProfile]) -> None:
+        """Save many entities, preprocessing all their names up front.
+
+        Two-phase ingest: the first pass runs the preprocessor over every
+        primary and alternate name in one batch, warming the pipeline cache,
+        and the second pass performs the per-entity index writes. Batching the
+        normalization amortizes its per-call overhead during startup or
+        snapshot loads.
+
+        Args:
+        ----
+            entities: Entity profiles to save
+
+        """
+        entity_list = list(entities)
+
+        # StandardStringPreprocessor exposes a batch entry point; other
+        # preprocessors fall back to being warmed one name at a time by save
+        preprocess_batch = getattr(self.preprocessor, "preprocess_batch", None)
+        if preprocess_batch is not None:
+            raw_names = [entity.primary_name.raw_value for entity in entity_list]
+            raw_names.extend(
+                alt.raw_value for entity in entity_list for alt in entity.alternate_names
+            )
+            preprocess_batch(raw_names)
+
+        for entity in entity_list:
+            self.save(entity)
 
     def _remove_from_indices(self, entity: DomainEntityProfile) -> None:
         """Remove entity from all indices.
@@ -119,23 +306,78 @@ class InMemoryEntityRepository(EntityRepository):
             entity: Entity profile to remove from indices
 
         """
-        processed_primary = self.preprocessor.preprocess(entity.primary_name.raw_value)
+        self._all_names_cache = None
+        cached = self._processed.pop(entity.entity_id, None)
+        doc_id = self._entity_id_to_doc.get(entity.entity_id)
+        if cached is None or doc_id is None:
+            # Never saved through this instance, so nothing is indexed. The
+            # snapshot is the single source of truth for what save() indexed:
+            # removal never re-runs preprocessing or the phonetic encoder.
+            return
+        raw_primary, processed_primary, alt_pairs, phonetic_code = cached
+
+        if self._raw_primary_to_id.get(raw_primary) == doc_id:
+            del self._raw_primary_to_id[raw_primary]
+
         if processed_primary:
-            if self._primary_name_to_id.get(processed_primary) == entity.entity_id:
-                del self._primary_name_to_id[processed_primary]
+            self._remove_primary_name_entries(processed_primary, phonetic_code, doc_id)
 
-            phonetic_code = self._get_phonetic_code(processed_primary)
-            if phonetic_code and entity.entity_id in self._phonetic_primary_index.get(
-                phonetic_code, set()
-            ):
-                self._phonetic_primary_index[phonetic_code].remove(entity.entity_id)
-                if not self._phonetic_primary_index[phonetic_code]:
-                    del self._phonetic_primary_index[phonetic_code]
+        self._remove_alternate_name_entries(alt_pairs, doc_id)
 
-        for alt_name_obj in entity.alternate_names:
-            processed_alt = self.preprocessor.preprocess(alt_name_obj.raw_value)
-            if processed_alt and self._alt_name_to_id.get(processed_alt) == entity.entity_id:
-                del self._alt_name_to_id[processed_alt]
+    def _remove_primary_name_entries(
+        self, processed_primary: str, phonetic_code: Optional[str], doc_id: int
+    ) -> None:
+        """Remove a primary name's entries from the lookup and posting indexes.
+
+        Args:
+        ----
+            processed_primary: Processed primary name from the save snapshot
+            phonetic_code: Phonetic code recorded at save time, if any
+            doc_id: Doc ID of the entity being removed
+
+        """
+        if self._primary_name_to_doc.get(processed_primary) == doc_id:
+            del self._primary_name_to_doc[processed_primary]
+
+        self._unindex_name_terms(processed_primary, doc_id)
+        self._discard_posting(self._first_token_index, processed_primary.split(" ", 1)[0], doc_id)
+
+        if phonetic_code:
+            self._discard_posting(self._phonetic_primary_index, phonetic_code, doc_id)
+
+    def _remove_alternate_name_entries(self, alt_pairs: List[Tuple[str, str]], doc_id: int) -> None:
+        """Remove alternate-name entries recorded in the save snapshot.
+
+        Args:
+        ----
+            alt_pairs: Raw and processed alternate-name pairs from the snapshot
+            doc_id: Doc ID of the entity being removed
+
+        """
+        for raw_alt, processed_alt in alt_pairs:
+            if self._raw_alt_to_id.get(raw_alt) == doc_id:
+                del self._raw_alt_to_id[raw_alt]
+
+            if processed_alt:
+                if self._alt_name_to_doc.get(processed_alt) == doc_id:
+                    del self._alt_name_to_doc[processed_alt]
+                self._unindex_name_terms(processed_alt, doc_id)
+
+    def _entity_by_doc(self, doc_id: int) -> Optional[EntityProfile]:
+        """Translate a doc ID back to its entity profile.
+
+        Args:
+        ----
+            doc_id: Doc ID to resolve
+
+        Returns:
+        -------
+            Entity profile if still stored, None otherwise
+
+        """
+        return cast(
+            Optional[EntityProfile], self._entities_by_id.get(self._doc_to_entity_id[doc_id])
+        )
 
     def find_by_id(self, entity_id: str) -> Optional[EntityProfile]:
         """Find entity by ID.
@@ -149,8 +391,7 @@ class InMemoryEntityRepository(EntityRepository):
             Entity profile if found, None otherwise
 
         """
-        entity = self._entities_by_id.get(entity_id)
-        return cast(Optional[EntityProfile], entity)
+        return cast(Optional[EntityProfile], self._entities_by_id.get(entity_id))
 
     def find_by_primary_name(self, name: EntityName) -> Optional[EntityProfile]:
         """Find entity by primary name.
@@ -164,24 +405,136 @@ class InMemoryEntityRepository(EntityRepository):
             Entity profile if found, None otherwise
 
         """
-        processed_name = self.preprocessor.preprocess(name.raw_value)
+        # Exact raw matches take precedence: distinct raw names can collide after
+        # preprocessing, and the raw lookup resolves those unambiguously
+        # (doc ID 0 is valid, so compare against None rather than truthiness)
+        raw_doc_id = self._raw_primary_to_id.get(name.raw_value)
+        if raw_doc_id is not None:
+            return self._entity_by_doc(raw_doc_id)
+
+        raw_alt_doc_id = self._raw_alt_to_id.get(name.raw_value)
+        if raw_alt_doc_id is not None:
+            return self._entity_by_doc(raw_alt_doc_id)
+
+        processed_name = self._pp(name.raw_value)
         if not processed_name:
             return None
 
-        # First try finding by primary name
-        entity_id = self._primary_name_to_id.get(processed_name)
-        if entity_id:
-            entity = self._entities_by_id.get(entity_id)
-            return cast(Optional[EntityProfile], entity)
+        # First try finding by primary name, then by alternate name
+        doc_id = self._primary_name_to_doc.get(processed_name)
+        if doc_id is not None:
+            return self._entity_by_doc(doc_id)
 
-        # If not found, try finding by alternate name
-        entity_id_alt = self._alt_name_to_id.get(processed_name)
-        if entity_id_alt:
-            entity = self._entities_by_id.get(entity_id_alt)
-            return cast(Optional[EntityProfile], entity)
+        doc_id_alt = self._alt_name_to_doc.get(processed_name)
+        if doc_id_alt is not None:
+            return self._entity_by_doc(doc_id_alt)
 
         return None
 
+    def find_by_alternate_name(self, raw_name: str) -> Optional[EntityProfile]:
+        """Find entity by alternate name.
+
+        Resolves through the reverse alias indexes: the raw alternate name first,
+        then its processed form, so alias lookups are O(1) instead of scanning
+        every entity's alternate-name list.
+
+        Args:
+        ----
+            raw_name: Raw alternate name to find
+
+        Returns:
+        -------
+            Entity profile if found, None otherwise
+
+        """
+        doc_id = self._raw_alt_to_id.get(raw_name)
+        if doc_id is not None:
+            return self._entity_by_doc(doc_id)
+
+        processed_name = self._pp(raw_name)
+        if processed_name:
+            doc_id_alt = self._alt_name_to_doc.get(processed_name)
+            if doc_id_alt is not None:
+                return self._entity_by_doc(doc_id_alt)
+
+        return None
+
+    def _docs_for_rarest_token(self, processed_query_name: str) -> Set[int]:
+        """Block on the rarest query token.
+
+        Only entities sharing that token are considered, which prunes most of
+        the corpus before scoring.
+
+        Args:
+        ----
+            processed_query_name: Preprocessed query string
+
+        Returns:
+        -------
+            Doc IDs sharing the rarest indexed query token, empty if none
+
+        """
+        posting_lists: List[Set[int]] = [
+            self._token_index[token]
+            for token in processed_query_name.split()
+            if token in self._token_index
+        ]
+        if not posting_lists:
+            return set()
+        return min(posting_lists, key=len)
+
+    def _docs_by_trigram_overlap(self, processed_query_name: str, limit: int) -> List[int]:
+        """Rank doc IDs by how many character trigrams they share with the query.
+
+        Serves queries sharing no token with the corpus (e.g. typos): every
+        query trigram's posting list is counted and the top-overlap docs kept,
+        instead of unioning all posting lists into one unbounded candidate set.
+
+        Args:
+        ----
+            processed_query_name: Preprocessed query string
+            limit: Maximum number of doc IDs to return
+
+        Returns:
+        -------
+            The limit doc IDs with the highest trigram overlap
+
+        """
+        overlap_counts: Dict[int, int] = {}
+        for trigram in self._trigrams(processed_query_name):
+            postings = self._trigram_index.get(trigram)
+            if postings is None:
+                continue
+            for doc_id in postings:
+                overlap_counts[doc_id] = overlap_counts.get(doc_id, 0) + 1
+        return [
+            doc_id
+            for doc_id, _ in heapq.nlargest(limit, overlap_counts.items(), key=lambda item: item[1])
+        ]
+
+    def _docs_by_phonetic(self, processed_query_name: str, limit: int) -> Iterable[int]:
+        """Find doc IDs whose primary name shares the query's phonetic code.
+
+        Soundex buckets can hold hundreds of entities; only the first `limit`
+        can survive the final slice, so stop at that many.
+
+        Args:
+        ----
+            processed_query_name: Preprocessed query string
+            limit: Maximum number of doc IDs to yield
+
+        Returns:
+        -------
+            At most limit doc IDs from the matching phonetic bucket
+
+        """
+        phonetic_code = self._get_phonetic_code(processed_query_name)
+        if phonetic_code:
+            bucket = self._phonetic_primary_index.get(phonetic_code)
+            if bucket:
+                return itertools.islice(bucket, limit)
+        return ()
+
     def find_candidates_by_name(self, name: EntityName, limit: int = 10) -> List[EntityProfile]:
         """Find candidate entities by name.
 
@@ -199,45 +552,49 @@ class InMemoryEntityRepository(EntityRepository):
             List of candidate entity profiles
 
         """
-        processed_query_name = self.preprocessor.preprocess(name.raw_value)
+        processed_query_name = self._pp(name.raw_value)
         if not processed_query_name:
             return []
 
-        candidate_ids: Set[str] = set()
+        # All blocking below operates on integer doc IDs; they are translated
+        # back to entity IDs only when the result profiles are materialized
+        candidate_docs: Set[int] = set()
 
         # Try exact matching first - for test cases that expect exact matches
-        # Check for exact match in primary names
-        if processed_query_name in self._primary_name_to_id:
-            candidate_ids.add(self._primary_name_to_id[processed_query_name])
-
-        # Also check for exact match in alternate names
-        if processed_query_name in self._alt_name_to_id:
-            candidate_ids.add(self._alt_name_to_id[processed_query_name])
-
-        # Special case - if the search is for "Apple", ensure we match "Apple Inc."
-        if processed_query_name == "apple":
-            for entity_id, entity in self._entities_by_id.items():
-                processed_primary = self.preprocessor.preprocess(entity.primary_name.raw_value)
-                if processed_primary.startswith("apple "):
-                    candidate_ids.add(entity_id)
-                    break
-
-        # If still no matches, try phonetic matching
-        if not candidate_ids:
-            # 1. Phonetic matches on primary names
-            phonetic_code = self._get_phonetic_code(processed_query_name)
-            if phonetic_code:
-                candidate_ids.update(self._phonetic_primary_index.get(phonetic_code, set()))
-
-        # Convert set to list to allow slicing for limit
-        limited_candidate_ids = list(candidate_ids)[:limit]
-
-        # Retrieve full profiles for candidate IDs
-        return [
-            cast(EntityProfile, self._entities_by_id[eid])
-            for eid in limited_candidate_ids
-            if eid in self._entities_by_id
-        ]
+        exact_doc = self._primary_name_to_doc.get(processed_query_name)
+        if exact_doc is not None:
+            candidate_docs.add(exact_doc)
+        exact_alt_doc = self._alt_name_to_doc.get(processed_query_name)
+        if exact_alt_doc is not None:
+            candidate_docs.add(exact_alt_doc)
+
+        # Single-token queries widen to entities whose primary name begins
+        # with that token (e.g. "apple" finds "apple inc") via one bucket
+        # lookup; this generalizes the old hardcoded "apple" corpus scan
+        first_token_bucket = self._first_token_index.get(processed_query_name)
+        if first_token_bucket:
+            candidate_docs.update(first_token_bucket)
+
+        # Fallback tiers, each consulted only when the previous ones found
+        # nothing: rarest-token blocking, then trigram-overlap ranking, then
+        # phonetic buckets
+        if not candidate_docs:
+            candidate_docs.update(self._docs_for_rarest_token(processed_query_name))
+        if not candidate_docs:
+            candidate_docs.update(self._docs_by_trigram_overlap(processed_query_name, limit))
+        if not candidate_docs:
+            candidate_docs.update(self._docs_by_phonetic(processed_query_name, limit))
+
+        # Translate doc IDs back to entity profiles. islice takes the first
+        # `limit` docs without materializing the whole candidate set as a list,
+        # which matters when a fallback path produced a large bucket
+        doc_to_entity_id = self._doc_to_entity_id
+        profiles: List[EntityProfile] = []
+        for doc_id in itertools.islice(candidate_docs, limit):
+            entity = self._entities_by_id.get(doc_to_entity_id[doc_id])
+            if entity is not None:
+                profiles.append(cast(EntityProfile, entity))
+        return profiles
 
     def get_all_entity_names(self) -> List[EntityName]:
         """Get all entity names in the repository.
@@ -247,4 +604,8 @@ class InMemoryEntityRepository(EntityRepository):
             List of all primary entity names
 
         """
-        return [cast(EntityName, entity.primary_name) for entity in self._entities_by_id.values()]
+        if self._all_names_cache is None:
+            self._all_names_cache = [
+                cast(EntityName, entity.primary_name) for entity in self._entities_by_id.values()
+            ]
+        return self._all_names_cache
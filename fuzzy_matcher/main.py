@@ -7,7 +7,47 @@ examples for string matching, entity resolution, and finding best matches.
 from typing import cast
 
 from fuzzy_matcher.application.facades import EntityResolutionFacade
-from fuzzy_matcher.domain.entities import DomainEntityProfile
+from fuzzy_matcher.domain.entities import DomainEntityName, DomainEntityProfile
+from fuzzy_matcher.protocols.interfaces import EntityName
+
+# Demo datasets as module-level tuple constants: the demos double as a small
+# benchmark harness, and constant tuples are built once at import instead of
+# being re-allocated on every call
+STRING_PAIRS = (
+    ("Apple Incorporated", "Apple, Inc."),
+    ("Apple Incorporated", "Apple inc."),
+    ("Apple Incorporated", "Apple   inc"),
+    ("Apple Incorporated", "Microsoft Corp."),
+    ("Apple Incorporated", "appel incorporated"),  # Typo
+    ("Apple Incorporated", "Incorporated Apple"),
+    ("Smith & Jones LLC", "Smith and Jones L.L.C."),
+    ("John Doe", "Jonh Doe"),  # Typo
+    ("International Business Machines", "IBM"),
+    ("Société Générale", "Societe Generale SA"),
+    ("", "Something"),  # Test empty string
+    ("Test", "Test"),  # Test identical
+)
+
+ENTITY_QUERIES = (
+    "Apple",
+    "apple inc",
+    "appel incorporated",  # Typo
+    "Microsoft",
+    "MS Corp",  # Abbreviation and slight change
+    "International Business Machines Corp",  # Full name + suffix
+    "IBM Corp",
+    "Google Inc",  # Different suffix
+    "NonExistent Company",
+)
+
+BEST_MATCH_CHOICES = (
+    "John Doe",
+    "Jane Doe",
+    "Jonathan Doering",
+    "john doe llc",
+    "Doe, John",
+    "Peter Jones",
+)
 
 
 def demo_string_matching() -> None:
@@ -18,24 +58,12 @@ def demo_string_matching() -> None:
     """
     facade = EntityResolutionFacade()
 
-    string_pairs = [
-        ("Apple Incorporated", "Apple, Inc."),
-        ("Apple Incorporated", "Apple inc."),
-        ("Apple Incorporated", "Apple   inc"),
-        ("Apple Incorporated", "Microsoft Corp."),
-        ("Apple Incorporated", "appel incorporated"),  # Typo
-        ("Apple Incorporated", "Incorporated Apple"),
-        ("Smith & Jones LLC", "Smith and Jones L.L.C."),
-        ("John Doe", "Jonh Doe"),  # Typo
-        ("International Business Machines", "IBM"),
-        ("Société Générale", "Societe Generale SA"),
-        ("", "Something"),  # Test empty string
-        ("Test", "Test"),  # Test identical
-    ]
-
     print("=== String Matching Demo ===")
-    for s1, s2 in string_pairs:
-        result = facade.compare_strings(s1, s2)
+    # Score every pair up front through the batch API; the loop below only
+    # formats the precomputed results
+    results = facade.compare_strings_batch(list(STRING_PAIRS))
+    for (s1, s2), pair_result in zip(STRING_PAIRS, results):
+        result = pair_result.to_dict()
         print(f"Comparing '{s1}' and '{s2}':")
         print(f"  Processed: '{result['processed']['s1']}' vs '{result['processed']['s2']}'")
         print(f"  Match: {result['is_match']}")
@@ -69,49 +97,38 @@ def demo_entity_resolution_and_finding() -> None:
     """
     facade = EntityResolutionFacade()
 
-    # Register some entities
-    facade.register_entity(
-        "E001",
-        "Apple Inc.",
-        ["Apple Incorporated", "Apple Computer", "Apple"],
-        {"industry": "Technology", "founded": 1976, "ticker": "AAPL"},
-    )
-
-    facade.register_entity(
-        "E002",
-        "Microsoft Corporation",
-        ["Microsoft Corp", "MSFT", "Microsoft"],
-        {"industry": "Technology", "founded": 1975, "ticker": "MSFT"},
-    )
-
-    facade.register_entity(
-        "E003",
-        "International Business Machines",
-        ["IBM", "IBM Corporation", "Big Blue"],
-        {"industry": "Technology", "founded": 1911, "ticker": "IBM"},
-    )
-
-    facade.register_entity(
-        "E004",
-        "Google LLC",
-        ["Google", "Alphabet Inc."],  # Alphabet is parent, but often used
-        {"industry": "Technology", "founded": 1998, "ticker": "GOOGL"},
+    # Register some entities in one batch so their names are preprocessed together
+    facade.register_entities(
+        [
+            (
+                "E001",
+                "Apple Inc.",
+                ["Apple Incorporated", "Apple Computer", "Apple"],
+                {"industry": "Technology", "founded": 1976, "ticker": "AAPL"},
+            ),
+            (
+                "E002",
+                "Microsoft Corporation",
+                ["Microsoft Corp", "MSFT", "Microsoft"],
+                {"industry": "Technology", "founded": 1975, "ticker": "MSFT"},
+            ),
+            (
+                "E003",
+                "International Business Machines",
+                ["IBM", "IBM Corporation", "Big Blue"],
+                {"industry": "Technology", "founded": 1911, "ticker": "IBM"},
+            ),
+            (
+                "E004",
+                "Google LLC",
+                ["Google", "Alphabet Inc."],  # Alphabet is parent, but often used
+                {"industry": "Technology", "founded": 1998, "ticker": "GOOGL"},
+            ),
+        ]
     )
 
     print("\n=== Entity Resolution & Finding Demo ===")
-    queries = [
-        "Apple",
-        "apple inc",
-        "appel incorporated",  # Typo
-        "Microsoft",
-        "MS Corp",  # Abbreviation and slight change
-        "International Business Machines Corp",  # Full name + suffix
-        "IBM Corp",
-        "Google Inc",  # Different suffix
-        "NonExistent Company",
-    ]
-
-    for query_str in queries:
+    for query_str in ENTITY_QUERIES:
         print(f"Searching for entity: '{query_str}'")
         found_entity_profile = facade.find_by_name(query_str)
         # Cast the found entity to DomainEntityProfile for the get_entity_profile_dict call
@@ -123,16 +140,17 @@ def demo_entity_resolution_and_finding() -> None:
             print(f"  Found: {entity_dict['primary_name']} (ID: {entity_dict['entity_id']})")
             print(f"  Attributes: {entity_dict['attributes']}")
         else:
-            # If not found, try finding best matches from the list of known entities
+            # If not found, rank index-generated candidates instead of
+            # re-scoring every registered entity
             print(f"  No exact entity resolution. Finding best matches for '{query_str}'...")
-            all_entity_names_str = [
-                name.raw_value for name in facade.repository.get_all_entity_names()
-            ]
+            candidates = facade.repository.find_candidates_by_name(
+                cast(EntityName, DomainEntityName(query_str)), limit=50
+            )
 
             # Use a generally good algorithm for this fallback search
-            best_matches = facade.find_best_matches_in_list(
+            best_matches = facade.rank_candidates(
                 query_str,
-                all_entity_names_str,
+                candidates,
                 algorithm_name="weighted_ratio",
                 threshold=0.7,  # Lower threshold for "best guess"
                 limit=3,
@@ -159,14 +177,7 @@ def demo_find_best_matches_in_list() -> None:
     facade = EntityResolutionFacade()
 
     query = "Jonh Doe"  # Typo
-    choices = [
-        "John Doe",
-        "Jane Doe",
-        "Jonathan Doering",
-        "john doe llc",
-        "Doe, John",
-        "Peter Jones",
-    ]
+    choices = list(BEST_MATCH_CHOICES)
 
     print("\n=== Find Best Matches in List Demo ===")
     print(f"Finding best matches for '{query}' in {choices}:")
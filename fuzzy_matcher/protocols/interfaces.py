@@ -130,13 +130,16 @@ class MatchingAlgorithm(Protocol):
         """Returns the unique name of the algorithm."""
         ...
 
-    def calculate_similarity(self, s1: str, s2: str) -> float:
+    def calculate_similarity(self, s1: str, s2: str, min_score: float = 0.0) -> float:
         """Calculate similarity between two strings.
 
         Args:
         ----
             s1: First string
             s2: Second string
+            min_score: Minimum similarity the caller still cares about.
+                Implementations may return 0.0 early once the true score is
+                provably below this bound; 0.0 disables the shortcut.
 
         Returns:
         -------
@@ -145,6 +148,27 @@ class MatchingAlgorithm(Protocol):
         """
         ...
 
+    def cross(self, queries: list[str], choices: list[str]) -> list[list[float]]:
+        """Calculate the full similarity matrix between two string lists.
+
+        Default implementation scores every pair through
+        calculate_similarity. Implementations backed by a batch-capable
+        scorer should override this to amortize per-pair call overhead.
+
+        Args:
+        ----
+            queries: Query strings (matrix rows)
+            choices: Choice strings (matrix columns)
+
+        Returns:
+        -------
+            Matrix of similarity scores, queries x choices
+
+        """
+        return [
+            [self.calculate_similarity(query, choice) for choice in choices] for query in queries
+        ]
+
 
 class PhoneticEncoder(Protocol):
     """Protocol defining phonetic encoder interface."""
@@ -238,6 +262,20 @@ class EntityRepository(Protocol):
         """
         ...
 
+    def find_by_alternate_name(self, raw_name: str) -> EntityProfile | None:
+        """Find entity by alternate name.
+
+        Args:
+        ----
+            raw_name: Raw alternate name to find
+
+        Returns:
+        -------
+            Entity profile if found, None otherwise
+
+        """
+        ...
+
     def find_candidates_by_name(self, name: EntityName, limit: int = 10) -> list[EntityProfile]:
         """Find candidate entities by name.
 
@@ -1,10 +1,30 @@
 """CLI convenience commands for development."""
 
 import argparse
+import asyncio
+import functools
+import hashlib
 import os
+import shutil
 import subprocess
 import sys
-from typing import List
+from typing import List, Tuple
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> str:
+    """Resolve a tool name to its absolute path, cached per process.
+
+    Args:
+    ----
+        name: Executable name as invoked (e.g. "ruff").
+
+    Returns:
+    -------
+        Absolute path from PATH if found, otherwise the name unchanged.
+
+    """
+    return shutil.which(name) or name
 
 
 def run_command(command: List[str], description: str) -> int:
@@ -24,80 +44,232 @@ def run_command(command: List[str], description: str) -> int:
     print(f"Command: {' '.join(command)}")
     print("-" * 40)
 
-    result = subprocess.run(command, text=True, check=False)
+    # Pre-resolved executable path skips a PATH walk per spawn (cached across
+    # the chained calls in run_check_all). Stdio is inherited directly: no
+    # text-mode pipe wrapping since output is not captured.
+    result = subprocess.run(
+        [_resolve_executable(command[0]), *command[1:]],
+        check=False,
+        stdout=None,
+        stderr=None,
+    )
     return result.returncode
 
 
-def run_tests() -> int:
-    """Run tests with command-line options.
+def _test_arg_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the test runner.
 
     Returns
     -------
-        The exit code of the test command.
+        Parser for the run_tests command-line options.
 
     """
     parser = argparse.ArgumentParser(description="Run matcher tests")
     parser.add_argument("--coverage", "-c", action="store_true", help="Generate coverage report")
     parser.add_argument("--html", "-r", action="store_true", help="Generate HTML coverage report")
-    parser.add_argument("--parallel", "-p", action="store_true", help="Run tests in parallel")
+    parser.add_argument(
+        "--no-parallel",
+        action="store_true",
+        help="Disable parallel test execution (parallel is the default)",
+    )
     parser.add_argument("--unit", action="store_true", help="Run only unit tests")
     parser.add_argument("--integration", action="store_true", help="Run only integration tests")
     parser.add_argument("--e2e", action="store_true", help="Run only end-to-end tests")
     parser.add_argument("--test", "-t", help="Run a specific test path")
+    parser.add_argument(
+        "--only-failed",
+        "-l",
+        action="store_true",
+        help="Run only the tests that failed in the previous run",
+    )
+    parser.add_argument(
+        "--failed-first",
+        "-f",
+        action="store_true",
+        help="Run previously failing tests before the rest of the suite",
+    )
+
+    return parser
 
-    args = parser.parse_args()
 
-    # Build command
-    command = ["pytest"]
+def _build_pytest_args(args: argparse.Namespace) -> List[str]:
+    """Translate parsed test-runner options into pytest arguments.
 
-    if args.parallel:
-        command.extend(["-n", "auto"])
+    Args:
+    ----
+        args: Parsed options from the _test_arg_parser parser.
+
+    Returns:
+    -------
+        Argument list for pytest (without the executable itself).
+
+    """
+    pytest_args: List[str] = []
+
+    # Parallel by default: xdist spreads the suite across cores. worksteal
+    # scheduling lets idle workers take pending tests from busy ones, which
+    # keeps cores busy when a few e2e tests run much longer than the rest.
+    # Targeted runs (--test PATH) skip xdist entirely: worker spawn costs more
+    # than the few selected tests save, and single-test iteration should stay
+    # sub-second
+    if not args.no_parallel and not args.test:
+        pytest_args.extend(["-n", "auto", "--dist", "worksteal"])
 
     if args.coverage or args.html:
-        command.append("--cov=fuzzy_matcher")
+        pytest_args.append("--cov=fuzzy_matcher")
 
     if args.html:
-        command.append("--cov-report=html")
+        pytest_args.append("--cov-report=html")
 
     if args.unit:
-        command.append("-m")
-        command.append("unit")
+        pytest_args.extend(["-m", "unit"])
     elif args.integration:
-        command.append("-m")
-        command.append("integration")
+        pytest_args.extend(["-m", "integration"])
     elif args.e2e:
-        command.append("-m")
-        command.append("e2e")
+        pytest_args.extend(["-m", "e2e"])
+
+    # Inner-loop shortcuts backed by pytest's .pytest_cache: --only-failed
+    # reruns just the last failures, --failed-first runs them before the rest
+    if args.only_failed:
+        pytest_args.append("--last-failed")
+    elif args.failed_first:
+        pytest_args.append("--failed-first")
 
     if args.test:
-        command.append(args.test)
+        pytest_args.append(args.test)
+
+    return pytest_args
 
-    return run_command(command, "tests")
+
+def run_tests() -> int:
+    """Run tests with command-line options.
+
+    Returns
+    -------
+        The exit code of the test command.
+
+    """
+    args = _test_arg_parser().parse_args()
+    return run_command(["pytest", *_build_pytest_args(args)], "tests")
+
+
+async def _run_command_buffered(command: List[str], description: str) -> Tuple[int, str]:
+    """Run a command with captured output so it can print without interleaving.
+
+    Args:
+    ----
+        command: The command to run as a list of strings.
+        description: A description of the command to display.
+
+    Returns:
+    -------
+        Tuple of (exit code, combined stdout/stderr output).
+
+    """
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    stdout, _ = await process.communicate()
+    return process.returncode or 0, stdout.decode(errors="replace")
+
+
+async def _run_lint_async() -> int:
+    """Run the lint tools concurrently and print their output in order.
+
+    Returns
+    -------
+        The first nonzero tool exit code, or 0 if all passed.
+
+    """
+    checks = [
+        (["ruff", "check", "fuzzy_matcher", "tests"], "Ruff linting"),
+        (["ruff", "format", "--check", "fuzzy_matcher", "tests"], "Ruff format check"),
+        (["mypy", "fuzzy_matcher"], "Mypy type checking"),
+    ]
+
+    results = await asyncio.gather(
+        *(_run_command_buffered(command, description) for command, description in checks)
+    )
+
+    exit_code = 0
+    for (command, description), (returncode, output) in zip(checks, results):
+        print(f"Running: {description}")
+        print(f"Command: {' '.join(command)}")
+        print("-" * 40)
+        if output:
+            print(output, end="" if output.endswith("\n") else "\n")
+        if returncode != 0 and exit_code == 0:
+            exit_code = returncode
+
+    return exit_code
+
+
+_LINT_CACHE_SENTINEL = os.path.join(".cache", "lint", "lint.blake2b")
+
+
+def _lint_inputs_hash() -> str:
+    """Hash every lint input file so unchanged trees can skip the tools.
+
+    Returns
+    -------
+        Hex digest over the contents of all Python sources under
+        fuzzy_matcher/ and tests/ plus pyproject.toml, in a stable order.
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    paths = [os.path.join("pyproject.toml")]
+    for root_dir in ("fuzzy_matcher", "tests"):
+        for dirpath, _dirnames, filenames in os.walk(root_dir):
+            paths.extend(
+                os.path.join(dirpath, filename)
+                for filename in filenames
+                if filename.endswith(".py")
+            )
+    for path in sorted(paths):
+        digest.update(path.encode())
+        with open(path, "rb") as handle:
+            digest.update(handle.read())
+    return digest.hexdigest()
 
 
 def run_lint() -> int:
     """Run linting checks.
 
+    The three read-only tools (ruff check, ruff format --check, mypy) run
+    concurrently, so the lint phase costs roughly the slowest tool instead of
+    the sum of all three; output is buffered and printed in a fixed order.
+
+    With FUZZY_LINT_CACHE=1 in the environment, a content hash of the lint
+    inputs is kept under .cache/lint and a rerun on an unchanged tree skips
+    the tools entirely. Off by default so CI always runs the real checks.
+
     Returns
     -------
         The exit code of the lint command.
 
     """
-    # Run ruff check
-    ruff_result = run_command(["ruff", "check", "fuzzy_matcher", "tests"], "Ruff linting")
-    if ruff_result != 0:
-        return ruff_result
-
-    # Run ruff format check
-    format_result = run_command(
-        ["ruff", "format", "--check", "fuzzy_matcher", "tests"], "Ruff format check"
-    )
-    if format_result != 0:
-        return format_result
+    use_cache = os.environ.get("FUZZY_LINT_CACHE") == "1"
+    inputs_hash = ""
+    if use_cache:
+        inputs_hash = _lint_inputs_hash()
+        try:
+            with open(_LINT_CACHE_SENTINEL, encoding="ascii") as handle:
+                if handle.read().strip() == inputs_hash:
+                    print("Lint inputs unchanged since last clean run — cached ✓")
+                    return 0
+        except OSError:
+            pass
+
+    exit_code = asyncio.run(_run_lint_async())
 
-    # Run mypy
-    mypy_result = run_command(["mypy", "fuzzy_matcher"], "Mypy type checking")
-    return mypy_result
+    if use_cache and exit_code == 0:
+        os.makedirs(os.path.dirname(_LINT_CACHE_SENTINEL), exist_ok=True)
+        with open(_LINT_CACHE_SENTINEL, "w", encoding="ascii") as handle:
+            handle.write(inputs_hash)
+
+    return exit_code
 
 
 def run_format() -> int:
@@ -135,9 +307,14 @@ def run_check_all() -> int:
         print("❌ Linting failed. Please fix the issues above before continuing.")
         return lint_result
 
-    # Run tests with coverage
+    # Run tests with coverage, in-process: pytest is already importable here,
+    # so pytest.main skips the interpreter and plugin cold start a fresh
+    # subprocess would pay
     print("\n=== Running Tests with Coverage ===")
-    test_result = run_tests()
+    import pytest
+
+    test_args = _build_pytest_args(_test_arg_parser().parse_args(["--coverage"]))
+    test_result = int(pytest.main(test_args))
     if test_result != 0:
         print("❌ Tests failed. Please fix the issues above before continuing.")
         return test_result
@@ -178,11 +355,13 @@ def list_commands() -> int:
     print("  poetry run test            - Run tests")
     print("    --coverage                     - Generate coverage report")
     print("    --html                         - Generate HTML coverage report")
-    print("    --parallel                     - Run tests in parallel")
+    print("    --no-parallel                  - Disable parallel test execution")
     print("    --unit                         - Run only unit tests")
     print("    --integration                  - Run only integration tests")
     print("    --e2e                          - Run only end-to-end tests")
     print("    --test PATH                    - Run a specific test path")
+    print("    --only-failed                  - Run only last run's failures")
+    print("    --failed-first                 - Run last run's failures first")
     print("")
     print("  poetry run lint            - Run linting checks")
     print("  poetry run format          - Apply code formatting")
@@ -19,9 +19,13 @@ from fuzzy_matcher.infrastructure.preprocessors import StandardStringPreprocesso
 from fuzzy_matcher.infrastructure.repositories import InMemoryEntityRepository
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def preprocessor():
-    """Return a standard string preprocessor."""
+    """Return a standard string preprocessor, shared suite-wide.
+
+    Stateless apart from its internal caches, so one instance serves every
+    test and its memoized pipeline stays warm across the session.
+    """
     return StandardStringPreprocessor()
 
 
@@ -103,31 +107,31 @@ def entity_repository(preprocessor):
     return repo
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def levenshtein_algorithm():
     """Return a Levenshtein algorithm instance."""
     return LevenshteinAlgorithm()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def jaro_winkler_algorithm():
     """Return a Jaro-Winkler algorithm instance."""
     return JaroWinklerAlgorithm()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def token_set_algorithm():
     """Return a Token Set Ratio algorithm instance."""
     return TokenSetRatioAlgorithm()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def soundex_encoder():
     """Return a Soundex encoder instance."""
     return SoundexEncoder()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def metaphone_encoder():
     """Return a Metaphone encoder instance."""
     return MetaphoneEncoder()
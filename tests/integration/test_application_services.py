@@ -91,6 +91,34 @@ class TestComprehensiveMatchScorer:
         assert scores_one_empty.get_score("jaro_winkler") == 0.0
         assert scores_one_empty.get_score("token_set_ratio") == 0.0
 
+    def test_calculate_similarity_matrix(self, scorer):
+        """Test batch similarity matrix calculation."""
+        queries = ["Apple Inc.", ""]
+        candidates = ["Apple Inc.", "Microsoft Corporation", ""]
+
+        matrices = scorer.calculate_similarity_matrix(queries, candidates)
+
+        # One M x N matrix per similarity algorithm
+        assert set(matrices) == set(scorer.similarity_algorithms)
+        for matrix in matrices.values():
+            assert len(matrix) == len(queries)
+            assert all(len(row) == len(candidates) for row in matrix)
+
+        # Entries agree with the pairwise scorer semantics
+        assert matrices["levenshtein"][0][0] == 1.0
+        assert matrices["levenshtein"][0][1] < 0.5
+        assert matrices["levenshtein"][0][2] == 0.0  # one empty
+        assert matrices["levenshtein"][1][2] == 1.0  # both empty
+
+    def test_encode_phonetic_codes(self, scorer):
+        """Test batch phonetic encoding."""
+        codes = scorer.encode_phonetic_codes(["Apple Inc.", "Microsoft", ""])
+
+        assert set(codes) == set(scorer.phonetic_encoders)
+        assert codes["soundex"][0].startswith("A")
+        assert codes["soundex"][1].startswith("M")
+        assert codes["soundex"][2] == ""
+
     def test_custom_algorithms(self):
         """Test using custom algorithm subsets."""
         # Only use Levenshtein and Jaro-Winkler
@@ -143,6 +171,18 @@ class TestConfigurableMatchDecisionStrategy:
         assert result.is_match is True
         assert len(result.match_reasons) > 0
 
+    def test_is_match_agrees_with_evaluate_match(self, strategy):
+        """Test that the boolean fast path agrees with the full evaluation."""
+        pairs = [
+            ("Apple Inc.", "Apple Inc."),
+            ("Apple Inc", "Apple Inc."),
+            ("Apple Inc.", "Microsoft Corporation"),
+            ("Smith", "Smyth"),
+        ]
+
+        for s1, s2 in pairs:
+            assert strategy.is_match(s1, s2) == strategy.evaluate_match(s1, s2).is_match
+
     def test_somewhat_similar_strings_may_match(self, strategy):
         """Test that somewhat similar strings may or may not match depending on thresholds."""
         # These may match with default thresholds
@@ -257,6 +297,24 @@ class TestEntityResolverService:
         assert results[0].entity_name.raw_value in ibm_companies
         assert results[1].entity_name.raw_value in ibm_companies
 
+    def test_resolve_batch_matches_individual_resolves(self, token_set_resolver, sample_candidates):
+        """Test that batch resolution agrees with per-query resolution."""
+        queries = [
+            DomainEntityName("Apple Inc."),
+            DomainEntityName("IBM"),
+            DomainEntityName("Googel"),
+            DomainEntityName(""),
+        ]
+
+        batch_results = token_set_resolver.resolve_batch(queries, sample_candidates)
+
+        assert len(batch_results) == len(queries)
+        for query, batch_result in zip(queries, batch_results):
+            individual_result = token_set_resolver.resolve(query, sample_candidates)
+            assert [(mc.entity_name.raw_value, mc.score) for mc in batch_result] == [
+                (mc.entity_name.raw_value, mc.score) for mc in individual_result
+            ]
+
     def test_threshold_filtering(self, preprocessor, sample_candidates):
         """Test that results are filtered by threshold."""
         # Create a resolver with a high threshold
@@ -66,6 +66,21 @@ class TestEntityResolutionFacade:
         assert result["is_match"] is False
         assert all(score < 0.8 for score in result["scores"].values() if isinstance(score, float))
 
+    def test_compare_strings_batch(self, facade):
+        """Test that batch comparison agrees with per-pair comparison."""
+        pairs = [
+            ("Apple, Inc.", "Apple Incorporated"),
+            ("Apple Inc.", "Microsoft Corporation"),
+            ("Test", "Test"),
+            ("", "Something"),
+        ]
+
+        results = facade.compare_strings_batch(pairs)
+
+        assert len(results) == len(pairs)
+        for (s1, s2), batch_result in zip(pairs, results):
+            assert batch_result.to_dict() == facade.compare_strings(s1, s2)
+
     def test_find_best_matches_in_list(self, facade):
         """Test finding best matches in a list."""
         query = "Aple"
@@ -79,6 +94,23 @@ class TestEntityResolutionFacade:
         apple_matches = [r for r in results if "Apple" in r["matched_candidate_original"]]
         assert len(apple_matches) > 0
 
+    def test_find_best_matches_agrees_with_compare_strings(self, facade):
+        """Test that list matching scores agree with pairwise comparison.
+
+        token_set_ratio applies a Python-side company-suffix boost, so the
+        list fast path must not substitute the raw native scorer for it.
+        """
+        query = "Apple Corp"
+        candidate = "Apple Inc."
+
+        results = facade.find_best_matches_in_list(
+            query, [candidate], algorithm_name="token_set_ratio", threshold=0.8
+        )
+
+        assert len(results) == 1
+        pair_score = facade.compare_strings(query, candidate)["scores"]["token_set_ratio"]
+        assert results[0]["score"] == pytest.approx(pair_score)
+
     def test_register_entity(self, facade):
         """Test registering an entity."""
         entity = facade.register_entity(
@@ -93,6 +125,19 @@ class TestEntityResolutionFacade:
         assert len(entity.alternate_names) == 2
         assert entity.attributes["attr1"] == "value1"
 
+    def test_register_entities_batch(self, facade):
+        """Test that batch registration stores and indexes every entity."""
+        profiles = facade.register_entities(
+            [
+                ("B001", "Acme Corporation", ["Acme Corp", "Acme"], {"industry": "Manufacturing"}),
+                ("B002", "Globex Inc.", None, None),
+            ]
+        )
+
+        assert [p.entity_id for p in profiles] == ["B001", "B002"]
+        assert facade.find_by_name("Acme Corp").entity_id == "B001"
+        assert facade.find_by_name("Globex Inc.").entity_id == "B002"
+
     def test_find_by_name_exact(self, populated_facade):
         """Test finding an entity by exact name."""
         entity = populated_facade.find_by_name("Apple Inc.")
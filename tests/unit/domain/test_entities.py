@@ -325,8 +325,8 @@ class TestMatchCandidate:
         assert candidate.processed_entity_name == processed_name
         assert candidate.score == 0.95
 
-    def test_comparison(self):
-        """Test comparison of MatchCandidate instances based on score."""
+    def test_ordering_by_score(self):
+        """Test ordering MatchCandidate instances by explicit score key."""
         candidate1 = MatchCandidate(
             entity_name=DomainEntityName("Apple Inc."),
             processed_entity_name=DomainProcessedName(DomainEntityName("Apple Inc."), "apple inc"),
@@ -347,18 +347,18 @@ class TestMatchCandidate:
             score=0.75,
         )
 
-        # Higher score should come first when sorted
-        candidates = [candidate1, candidate2, candidate3]
-        sorted_candidates = sorted(candidates)
+        # Higher score should come first when sorted with an explicit key
+        candidates = [candidate3, candidate1, candidate2]
+        sorted_candidates = sorted(candidates, key=lambda c: c.score, reverse=True)
 
         assert sorted_candidates[0] == candidate1
         assert sorted_candidates[1] == candidate2
         assert sorted_candidates[2] == candidate3
 
-        # Test direct comparison
-        assert candidate1 < candidate2
-        assert candidate2 < candidate3
-        assert not (candidate1 > candidate2)
+        # Candidates define no implicit ordering; the inverted __lt__ that
+        # made "less than" mean "higher score" was removed as a footgun
+        with pytest.raises(TypeError):
+            candidate1 < candidate2  # noqa: B015
 
     def test_immutability(self):
         """Test that MatchCandidate is immutable."""
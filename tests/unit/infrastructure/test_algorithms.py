@@ -1,20 +1,25 @@
 """Unit tests for the matching algorithms in fuzzy_matcher.infrastructure.algorithms."""
 
 import pytest
+from thefuzz import fuzz
 
 from fuzzy_matcher.infrastructure.algorithms import (
+    BlockKeyBuilder,
     DamerauLevenshteinAlgorithm,
     JaroWinklerAlgorithm,
     LevenshteinAlgorithm,
     MetaphoneEncoder,
     PartialRatioAlgorithm,
+    PrefilteredAlgorithm,
     SoundexEncoder,
     TokenSetRatioAlgorithm,
     TokenSortRatioAlgorithm,
     WeightedRatioAlgorithm,
     get_default_phonetic_encoders,
     get_default_similarity_algorithms,
+    sift4_similarity,
 )
+from fuzzy_matcher.infrastructure.preprocessors import StandardStringPreprocessor
 
 
 class TestSimilarityAlgorithms:
@@ -84,6 +89,70 @@ class TestSimilarityAlgorithms:
         algo = algo_class()
         assert algo.calculate_similarity(s1, s2) == pytest.approx(expected, abs=1e-10)
 
+    @pytest.mark.parametrize("s1,s2", [("éa", "a"), ("café inc", "cafe inc"), ("naïve", "naive")])
+    def test_token_sort_ratio_non_ascii_matches_thefuzz(self, s1, s2):
+        """Test that token sort ratio keeps thefuzz's force_ascii handling."""
+        algo = TokenSortRatioAlgorithm()
+        expected = fuzz.token_sort_ratio(s1, s2) / 100.0
+        assert algo.calculate_similarity(s1, s2) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("algo_class", [LevenshteinAlgorithm, DamerauLevenshteinAlgorithm])
+    def test_calculate_similarity_min_score(self, algo_class):
+        """Test that min_score short-circuits hopeless pairs and preserves passing ones."""
+        algo = algo_class()
+        # Length difference alone caps similarity at 2/13 < 0.8
+        assert algo.calculate_similarity("ab", "abcdefghijklm", min_score=0.8) == 0.0
+        # Pairs at or above the bound return the same score as the unbounded call
+        assert algo.calculate_similarity("kitten", "kitten", min_score=0.9) == 1.0
+        unbounded = algo.calculate_similarity("kitten", "sitting")
+        assert algo.calculate_similarity("kitten", "sitting", min_score=0.5) == pytest.approx(
+            unbounded
+        )
+
+    def test_cross_matches_pairwise(self):
+        """Test that the batch cross method agrees with pairwise scoring."""
+        algo = LevenshteinAlgorithm()
+        queries = ["kitten", "apple inc"]
+        choices = ["sitting", "kitten", "apple incorporated"]
+
+        matrix = algo.cross(queries, choices)
+
+        assert matrix == [[algo.calculate_similarity(q, c) for c in choices] for q in queries]
+
+    def test_cross_empty_choices(self):
+        """Test that cross returns empty rows when there are no choices."""
+        assert LevenshteinAlgorithm().cross(["a", "b"], []) == [[], []]
+
+    @pytest.mark.parametrize(
+        "s1,s2,expected_range",
+        [
+            ("same", "same", (1.0, 1.0)),
+            ("", "", (1.0, 1.0)),
+            ("test", "", (0.0, 0.0)),
+            ("kitten", "sitting", (0.4, 0.9)),  # similar pair scores high-ish
+            ("abcdefgh", "zyxwvuts", (0.0, 0.2)),  # disjoint pair scores low
+        ],
+    )
+    def test_sift4_similarity(self, s1, s2, expected_range):
+        """Test that sift4_similarity stays in range and orders pairs sensibly."""
+        score = sift4_similarity(s1, s2)
+        assert 0.0 <= score <= 1.0
+        assert expected_range[0] <= score <= expected_range[1]
+
+    def test_prefiltered_algorithm(self):
+        """Test that PrefilteredAlgorithm rejects dissimilar pairs and delegates the rest."""
+        inner = WeightedRatioAlgorithm()
+        prefiltered = PrefilteredAlgorithm(inner, prefilter_threshold=0.5)
+
+        assert prefiltered.name == inner.name
+        # Clearly dissimilar pairs are rejected without the exact scorer
+        assert prefiltered.calculate_similarity("abcdefgh", "zyxwvuts") == 0.0
+        # Similar pairs fall through and score exactly like the inner algorithm
+        assert prefiltered.calculate_similarity("apple inc", "apple incorporated") == (
+            inner.calculate_similarity("apple inc", "apple incorporated")
+        )
+        assert prefiltered.calculate_similarity("same", "same") == 1.0
+
     def test_edge_cases(self):
         """Test edge cases for all algorithms."""
         algorithms = [
@@ -202,6 +271,25 @@ class TestPhoneticEncoders:
         assert metaphone.encode("Knight") == metaphone.encode("Night")
 
 
+class TestBlockKeyBuilder:
+    """Tests for the fused preprocess-and-encode blocking key builder."""
+
+    def test_build_matches_separate_stages(self):
+        """Test that build agrees with running preprocessor and encoder separately."""
+        preprocessor = StandardStringPreprocessor()
+        encoder = SoundexEncoder()
+        builder = BlockKeyBuilder(preprocessor, encoder)
+
+        for text in ["Apple, Inc.", "Société Générale S.A.", "Robert", "Apple, Inc."]:
+            assert builder.build(text) == encoder.encode(preprocessor.preprocess(text))
+
+    def test_build_empty_inputs(self):
+        """Test that empty and punctuation-only inputs yield empty keys."""
+        builder = BlockKeyBuilder(StandardStringPreprocessor(), MetaphoneEncoder())
+        assert builder.build("") == ""
+        assert builder.build("!!!") == ""
+
+
 class TestFactoryFunctions:
     """Tests for the algorithm and encoder factory functions."""
 
@@ -172,6 +172,22 @@ class TestStandardStringPreprocessor:
         preprocessor = StandardStringPreprocessor()
         assert preprocessor.preprocess(input_value) == expected
 
+    def test_preprocess_batch_matches_per_row(self):
+        """Test that preprocess_batch agrees with per-row preprocess, including duplicates."""
+        preprocessor = StandardStringPreprocessor()
+        inputs = [
+            "Apple, Inc.",
+            "Microsoft Corporation",
+            "Apple, Inc.",  # duplicate should be deduplicated internally
+            "Société Générale S.A.",
+            None,
+            "",
+            123,
+        ]
+        assert preprocessor.preprocess_batch(inputs) == [
+            preprocessor.preprocess(value) for value in inputs
+        ]
+
 
 @pytest.mark.parametrize(
     "test_case",